@@ -13,23 +13,14 @@ binaries = []
 
 # Packages that need complete collection (code + data + metadata)
 packages_to_collect = [
-    'eth_account',
-    'eth_keys',
     'eth_utils',
-    'eth_abi',
     'eth_typing',
     'eth_hash',
-    'eth_rlp',
-    'eth_keyfile',
-    'py_ecc',
     'cytoolz',
     'toolz',
-    'hexbytes',
-    'rlp',
-    'bitarray',
-    'parsimonious',
     'Crypto',
-    'ecdsa',
+    'orjson',
+    'coincurve',
 ]
 
 for package in packages_to_collect:
@@ -82,6 +73,7 @@ a = Analysis(
         'uvicorn.loops',
         'uvicorn.loops.auto',
         'uvicorn.loops.asyncio',
+        'uvicorn.loops.uvloop',
         'uvicorn.protocols',
         'uvicorn.protocols.http',
         'uvicorn.protocols.http.auto',
@@ -121,29 +113,23 @@ a = Analysis(
         'pydantic.main',
         'pydantic_core',
 
-        # Ethereum
-        'eth_account',
-        'eth_account.messages',
-        'eth_account.signers',
-        'eth_account.hdaccount',
-        'eth_keys',
+        # JSON
+        'orjson',
+
+        # secp256k1
+        'coincurve',
+
+        # Ethereum (keccak for L1 signatures; eth_hash uses the pycryptodome backend)
         'eth_utils',
-        'eth_abi',
         'eth_typing',
         'eth_hash',
         'eth_hash.auto',
-        'eth_rlp',
-        'eth_keyfile',
-        'py_ecc',
-        'py_ecc.secp256k1',
-        'py_ecc.optimized_bn128',
 
         # Cryptography
         'Crypto',
         'Crypto.Hash',
         'Crypto.Cipher',
         'Crypto.Random',
-        'ecdsa',
 
         # Other dependencies
         'anyio',
@@ -153,12 +139,10 @@ a = Analysis(
         'typing_extensions',
         'cytoolz',
         'toolz',
-        'bitarray',
-        'hexbytes',
-        'rlp',
-        'parsimonious',
         'websockets',
         'httptools',
+        'uvloop',
+        'winloop',
     ],
     hookspath=[],
     hooksconfig={},
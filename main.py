@@ -8,17 +8,26 @@ A beautiful GUI application to manage the lighter-signing-service HTTP server.
 APP_VERSION = "0.1.4"
 
 import customtkinter as ctk
+import tkinter
+import collections
+import compileall
+import functools
+import importlib.util
 import os
+import re
 import sys
 import subprocess
+import tempfile
+import atexit
 import threading
 import time
-import logging
 import io
+import queue
 import traceback
 import asyncio
 import webbrowser
 import socket
+import psutil
 from pathlib import Path
 from typing import Optional
 from PIL import Image
@@ -27,34 +36,83 @@ from PIL import Image
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
-
-class GUILogHandler(logging.Handler):
-    """Custom logging handler that sends logs to the GUI"""
-    def __init__(self, gui_log_callback):
-        super().__init__()
-        self.gui_log_callback = gui_log_callback
-
-    def emit(self, record):
-        try:
-            msg = self.format(record)
-            # Determine log level
-            if record.levelno >= logging.ERROR:
-                level = "ERROR"
-            elif record.levelno >= logging.WARNING:
-                level = "WARNING"
-            elif record.levelno >= logging.INFO:
-                level = "SERVICE"
-            else:
-                level = "SERVICE"
-
-            # Send to GUI (thread-safe)
-            self.gui_log_callback(msg, level)
-        except Exception:
-            self.handleError(record)
+# Directory holding the bundled resources (logo, service)
+if getattr(sys, 'frozen', False):
+    # Running as compiled executable (PyInstaller)
+    # PyInstaller extracts files to sys._MEIPASS
+    APP_DIR = Path(getattr(sys, '_MEIPASS', Path(sys.executable).parent))
+else:
+    # Running as script
+    APP_DIR = Path(__file__).parent
+
+# Command line flag that makes the executable run the signing service instead of the GUI
+SERVICE_ARG = "--service"
+
+# Shared colors (light mode, dark mode)
+ACCENT = ("#818CF8", "#818CF8")  # Purple
+ACCENT_HOVER = ("#6366F1", "#6366F1")
+SUCCESS_GREEN = ("#52C41A", "#52C41A")
+SUCCESS_HOVER = ("#389E0D", "#389E0D")
+DANGER = ("#FF4D4F", "#FF4D4F")
+DANGER_HOVER = ("#CF1322", "#CF1322")
+BAR_BG = ("gray90", "gray10")  # Header and footer
+CARD_BG = ("gray95", "gray15")
+TEXT_PRIMARY = ("gray10", "white")
+TEXT_SECONDARY = ("gray30", "gray80")
+TEXT_SUBTLE = ("gray40", "gray70")
+TEXT_MUTED = ("gray50", "gray60")
+GHOST_BORDER = ("gray70", "gray40")  # Outlined buttons
+GHOST_HOVER = ("gray85", "gray25")
+
+# Theme -> (theme button text, log message); the button offers the other theme
+THEMES = {
+    "dark": ("☀️ Light", "Switched to dark theme"),
+    "light": ("🌙 Dark", "Switched to light theme"),
+}
+THEME_TOGGLE = {"dark": "light", "light": "dark"}
+
+# Widget options applied by update_ui_state for each service state
+UI_RUNNING = {
+    "indicator": {"text": "●", "text_color": SUCCESS_GREEN},
+    "status": {"text": "服务运行中"},
+    "start": {"state": "disabled", "text": "✓  已启动"},
+    "stop": {"state": "normal"},
+}
+UI_STOPPED = {
+    "indicator": {"text": "●", "text_color": DANGER},
+    "status": {"text": "服务未运行"},
+    "start": {"state": "normal", "text": "▶  启动服务"},
+    "stop": {"state": "disabled"},
+}
+
+# Log level colors (light mode, dark mode)
+LOG_LEVEL_COLORS = {
+    "INFO": ("#666666", "#999999"),
+    "SUCCESS": SUCCESS_GREEN,
+    "WARNING": ("#FAAD14", "#FAAD14"),
+    "ERROR": DANGER,
+    "SERVICE": ACCENT
+}
+LOG_TIMESTAMP_COLOR = "#999999"
+
+# The log textbox is cut back to LOG_TRIM_TO lines once it grows past LOG_TRIM_AT
+LOG_TRIM_AT = 1000
+LOG_TRIM_TO = 800
+
+
+# Classifies a service output line for StreamToLogger. Each branch is a lookahead over the
+# whole line, tried in order, so the first branch that matches anywhere wins.
+_STREAM_LEVEL_RE = re.compile(
+    r"(?=.*?(?:ERROR|CRITICAL|Exception|Traceback))(?P<error>)"
+    r"|(?=.*?WARN)(?P<warning>)"
+    r"|(?=.*?(?:INFO|DEBUG):)(?P<info>)"
+    r"|(?=.*?(?:Started server|Uvicorn running|Application startup|(?i:shutdown)))(?P<service>)",
+    re.DOTALL
+)
 
 
 class StreamToLogger:
-    """Redirect stdout/stderr to logger"""
+    """Forward the service child's output lines to the GUI log"""
     def __init__(self, log_callback, default_level="SERVICE"):
         self.log_callback = log_callback
         self.default_level = default_level
@@ -65,20 +123,20 @@ class StreamToLogger:
             if message and message.strip():
                 msg = message.strip()
 
-                # Determine level based on message content
+                # Determine level based on message content (one regex pass)
                 level = self.default_level
-                if "ERROR" in msg or "CRITICAL" in msg or "Exception" in msg or "Traceback" in msg:
-                    level = "ERROR"
-                elif "WARNING" in msg or "WARN" in msg:
-                    level = "WARNING"
-                elif "INFO:" in msg or "DEBUG:" in msg:
-                    # Remove the INFO: or DEBUG: prefix for cleaner display
-                    msg = msg.replace("INFO:", "").replace("DEBUG:", "").strip()
-                    level = "SERVICE"
-                elif "Started server" in msg or "Uvicorn running" in msg or "Application startup" in msg:
-                    level = "SERVICE"
-                elif "Shutting down" in msg or "shutdown" in msg.lower():
-                    level = "SERVICE"
+                match = _STREAM_LEVEL_RE.match(msg)
+                if match:
+                    kind = match.lastgroup
+                    if kind == "error":
+                        level = "ERROR"
+                    elif kind == "warning":
+                        level = "WARNING"
+                    else:
+                        if kind == "info" and msg.startswith(("INFO:", "DEBUG:")):
+                            # Remove the INFO: or DEBUG: prefix for cleaner display
+                            msg = msg[msg.index(":") + 1:].lstrip()
+                        level = "SERVICE"
 
                 self.log_callback(msg, level)
         except Exception:
@@ -95,14 +153,54 @@ class StreamToLogger:
         return -1
 
 
-def is_port_in_use(port: int) -> bool:
-    """Check if a port is in use"""
+# Not exported by every Python build on Windows; the value is ~SO_REUSEADDR
+SO_EXCLUSIVEADDRUSE = getattr(socket, "SO_EXCLUSIVEADDRUSE", ~socket.SO_REUSEADDR)
+
+# Last bind() probe per port: port -> (time.monotonic() of the probe, in use)
+_port_probe_cache = {}
+PORT_PROBE_TTL = 0.25  # seconds
+
+
+def is_port_in_use(port: int, max_age: float = PORT_PROBE_TTL) -> bool:
+    """Check if a port is in use (probes younger than max_age seconds are reused)"""
+    now = time.monotonic()
+    cached = _port_probe_cache.get(port)
+    if cached and now - cached[0] < max_age:
+        return cached[1]
+
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        if sys.platform == 'win32':
+            # Exclusive binding fails whenever anything holds the port, including
+            # listeners that set SO_REUSEADDR, which a plain bind would slip past
+            s.setsockopt(socket.SOL_SOCKET, SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            # Match uvicorn, which sets SO_REUSEADDR on POSIX, so sockets left in
+            # TIME_WAIT do not count as "in use"
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
+            # Probe the wildcard address uvicorn binds (see run_service). A loopback probe
+            # can miss a wildcard listener on macOS/BSD, where SO_REUSEADDR lets a specific
+            # address share the port with it; binding without listen() exposes nothing.
             s.bind(('0.0.0.0', port))
-            return False
+            in_use = False
         except OSError:
+            in_use = True
+
+    _port_probe_cache[port] = (now, in_use)
+    return in_use
+
+
+# Sleeps between port checks while waiting for a killed process to release its port
+PORT_RELEASE_BACKOFF = (0.05, 0.1, 0.2, 0.4, 0.8, 1.5)
+
+
+def wait_for_port_release(port: int) -> bool:
+    """Poll with backoff until the port is free; False if it never frees up"""
+    for delay in PORT_RELEASE_BACKOFF:
+        if not is_port_in_use(port, max_age=0):
             return True
+        time.sleep(delay)
+    return not is_port_in_use(port, max_age=0)
 
 
 def get_local_ip() -> str:
@@ -128,7 +226,6 @@ def get_local_ip() -> str:
     except Exception:
         # Method 2: Platform-specific fallback
         try:
-            import subprocess
             if sys.platform == 'darwin':  # macOS
                 # Try to get IP from common network interfaces
                 for interface in ['en0', 'en1', 'en2']:
@@ -185,22 +282,11 @@ def get_process_using_port(port: int) -> Optional[int]:
         return None
 
     try:
-        import subprocess
-        result = subprocess.run(
-            ['netstat', '-ano'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        for line in result.stdout.splitlines():
-            if f':{port}' in line and 'LISTENING' in line:
-                parts = line.split()
-                if len(parts) >= 5:
-                    try:
-                        return int(parts[-1])
-                    except ValueError:
-                        pass
+        # Ask the OS connection table directly instead of spawning and parsing netstat.
+        # Only TCP sockets can be LISTENING, so skip fetching the UDP tables.
+        for conn in psutil.net_connections(kind='tcp'):
+            if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_LISTEN:
+                return conn.pid
     except Exception:
         pass
     return None
@@ -214,15 +300,204 @@ def kill_process_on_port(port: int) -> bool:
     pid = get_process_using_port(port)
     if pid:
         try:
-            subprocess.run(['taskkill', '/F', '/PID', str(pid)],
-                         capture_output=True, timeout=10)
-            time.sleep(1)  # Wait for process to die
-            return True
-        except Exception:
+            proc = psutil.Process(pid)
+            proc.kill()
+            proc.wait(timeout=5)  # Wait for process to die
+        except psutil.NoSuchProcess:
             pass
+        except Exception:
+            return False
+        # The port owner is gone, so a cached "in use" probe is now stale
+        _port_probe_cache.pop(port, None)
+        return True
     return False
 
 
+@functools.lru_cache(maxsize=4)
+def load_logo_image(name: str = "logo.png") -> Optional[Image.Image]:
+    """Decode a bundled image once; None if the file is missing"""
+    path = APP_DIR / name
+    if not path.exists():
+        return None
+    with Image.open(path) as image:
+        return image.copy()
+
+
+def get_service_command(port: int) -> list:
+    """Build the command line that runs the signing service in a child process"""
+    if getattr(sys, 'frozen', False):
+        # The bundled executable is this GUI; SERVICE_ARG switches it to service mode
+        return [sys.executable, SERVICE_ARG, str(port)]
+    return [sys.executable, "-u", str(Path(__file__).resolve()), SERVICE_ARG, str(port)]
+
+
+# Logging for the service child: uvicorn and the service's own records become one
+# "LEVEL: message" line each on stdout, which the GUI reads from the pipe
+SERVICE_LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "plain": {"format": "%(levelname)s: %(message)s"},
+    },
+    "handlers": {
+        "stdout": {
+            "class": "logging.StreamHandler",
+            "formatter": "plain",
+            "stream": "ext://sys.stdout",
+        },
+    },
+    "loggers": {
+        "asyncio": {"level": "WARNING"},
+    },
+    "root": {"handlers": ["stdout"], "level": "INFO"},
+}
+
+
+# Seconds the service child gets to shut down after its stdin closes before exiting hard
+SERVICE_EXIT_TIMEOUT = 5
+
+
+def run_service(port: int):
+    """Run the signing service in this process (child side of start_service)"""
+    import uvicorn
+
+    # Windowed builds may start without std streams; the GUI reads UTF-8 lines from a pipe
+    if sys.stdout is None:
+        sys.stdout = open(os.devnull, "w")
+    if sys.stderr is None:
+        sys.stderr = sys.stdout
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding="utf-8", errors="replace", line_buffering=True)
+        except (AttributeError, ValueError):
+            pass
+
+    # Add service directory to path
+    service_dir = APP_DIR / "service"
+    service_path = str(service_dir)
+    if service_path not in sys.path:
+        sys.path.insert(0, service_path)
+
+    # Load the service module to get the FastAPI app (this is slow on first run)
+    spec = importlib.util.spec_from_file_location("service_main", service_dir / "main.py")
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Failed to load service module")
+    service_module = importlib.util.module_from_spec(spec)
+    sys.modules["service_main"] = service_module
+    spec.loader.exec_module(service_module)
+
+    # On Windows, we need to set the event loop policy explicitly
+    # to avoid issues with ProactorEventLoop in packaged apps. uvicorn's "auto" loop
+    # only knows uvloop, which has no Windows build, so use winloop when it's bundled.
+    if sys.platform == 'win32':
+        try:
+            import winloop
+            asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+        except ImportError:
+            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    config = uvicorn.Config(
+        app=service_module.app,
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        log_config=SERVICE_LOG_CONFIG,
+        access_log=True,
+        timeout_graceful_shutdown=1,  # Fast shutdown to release port quickly
+        limit_concurrency=100,
+        backlog=50
+    )
+    server = uvicorn.Server(config)
+
+    # The GUI stops the service by closing our stdin. That lets uvicorn drain in-flight
+    # requests on Windows too, where Popen.terminate() is TerminateProcess. The pipe
+    # also closes when the GUI crashes or is killed, so an orphaned service shuts down
+    # instead of holding the port; if shutdown hangs (e.g. a stuck signer call), exit hard.
+    def watch_stdin():
+        try:
+            sys.stdin.buffer.read()
+        except (OSError, ValueError):
+            pass
+        server.should_exit = True
+        time.sleep(SERVICE_EXIT_TIMEOUT)
+        os._exit(1)
+
+    if sys.stdin is not None:
+        threading.Thread(target=watch_stdin, name="stdin-watch", daemon=True).start()
+
+    server.run()
+
+
+# Strategy cards shown side by side - all with same badge color
+STRATEGIES = [
+    {
+        "name": "Lighter-EdgeX [002]",
+        "desc": "结合两大核心插件优势，提供超低磨损率，是追求稳定高收益的最佳选择",
+        "wear_rate": "磨损率 0.023% - 0.025%",
+        "badge": "已上线",
+        "badge_color": SUCCESS_GREEN  # Green for all
+    },
+    {
+        "name": "Lighter-Based [003]",
+        "desc": "基于 Based 协议的策略，平衡收益与风险，支持大部分 token",
+        "wear_rate": "磨损率 0.02% - 0.023%",
+        "badge": "已上线",
+        "badge_color": SUCCESS_GREEN  # Green for all
+    },
+    {
+        "name": "Lighter-Backpack [005]",
+        "desc": "集成 Backpack 生态，灵活的磨损率范围适应不同市场环境，支持大部分 token",
+        "wear_rate": "磨损率 0.014% - 0.035%",
+        "badge": "已上线",
+        "badge_color": SUCCESS_GREEN  # Green for all
+    }
+]
+
+
+class StrategyCard(ctk.CTkFrame):
+    """Strategy information card: name and badge, description, wear rate"""
+    def __init__(self, master, strategy: dict, font):
+        super().__init__(master, corner_radius=15, fg_color=CARD_BG, border_width=0)
+        self.grid_columnconfigure(0, weight=1)
+
+        # Card header: title on the left, badge on the right
+        ctk.CTkLabel(
+            self,
+            text=strategy["name"],
+            font=font(16, "bold"),
+            text_color=TEXT_PRIMARY
+        ).grid(row=0, column=0, sticky="w", padx=(25, 0), pady=(15, 8))
+
+        ctk.CTkLabel(
+            self,
+            text=strategy["badge"],
+            font=font(11, "bold"),
+            text_color="white",
+            fg_color=strategy["badge_color"],
+            corner_radius=10,
+            padx=10,
+            pady=3
+        ).grid(row=0, column=1, padx=(10, 35), pady=(15, 8), sticky="e")
+
+        # Card description
+        ctk.CTkLabel(
+            self,
+            text=strategy["desc"],
+            font=font(11),
+            text_color=TEXT_MUTED,
+            wraplength=250,  # Reduced for horizontal layout
+            justify="left"
+        ).grid(row=1, column=0, columnspan=2, sticky="w", padx=20, pady=(0, 8))
+
+        # Wear rate
+        ctk.CTkLabel(
+            self,
+            text=strategy["wear_rate"],
+            font=font(12, "bold"),
+            text_color=TEXT_SECONDARY
+        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=25, pady=(0, 15))
+
+
 class LighterSigningServiceGUI(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -234,39 +509,29 @@ class LighterSigningServiceGUI(ctk.CTk):
 
         # Set window icon
         try:
-            if getattr(sys, 'frozen', False):
-                # Running as compiled executable
-                if hasattr(sys, '_MEIPASS'):
-                    icon_path = Path(sys._MEIPASS) / "logo.png"
-                else:
-                    icon_path = Path(sys.executable).parent / "logo.png"
-            else:
-                # Running as script
-                icon_path = Path(__file__).parent / "logo.png"
-
-            if icon_path.exists():
-                self.iconphoto(True, ctk.CTkImage(Image.open(icon_path), size=(32, 32))._light_image)
+            logo = load_logo_image()
+            if logo is not None:
+                self.iconphoto(True, ctk.CTkImage(logo, size=(32, 32))._light_image)
         except Exception as e:
             print(f"Could not load icon: {e}")
 
         # Service state
         self.service_process: Optional[subprocess.Popen] = None
         self.service_running = False
-        self.uvicorn_server = None
+        # True between stop_service and the service process exiting
+        self._stopping = False
+        # Process most recently asked to stop; its exit code is not reported as a failure
+        self._stop_requested: Optional[subprocess.Popen] = None
+        # Called once the stopping service has exited (set by on_closing)
+        self._on_stopped = None
+        # Shutdown is polled from the event loop: up to shutdown_grace_ms, every shutdown_poll_ms
+        self.shutdown_grace_ms = 5000
+        self.shutdown_poll_ms = 50
 
         # Service directory is bundled with the application
-        if getattr(sys, 'frozen', False):
-            # Running as compiled executable (PyInstaller)
-            # PyInstaller extracts files to sys._MEIPASS
-            if hasattr(sys, '_MEIPASS'):
-                application_path = Path(sys._MEIPASS)
-            else:
-                application_path = Path(sys.executable).parent
-        else:
-            # Running as script
-            application_path = Path(__file__).parent
-
-        self.service_dir = application_path / "service"
+        self.service_dir = APP_DIR / "service"
+        # Whether service/main.py was found by the last _scan_service_dir
+        self._service_ok = False
         self.service_port = 10000
 
         # Get local IP address
@@ -275,11 +540,56 @@ class LighterSigningServiceGUI(ctk.CTk):
         # Theme state
         self.current_theme = "dark"
 
+        # Log messages are queued from any thread and drained on the Tk main thread
+        self._log_queue = queue.SimpleQueue()
+        # True while a <<LogReady>> wakeup is on its way to the drainer
+        self._log_wakeup_pending = False
+        # Last 1000 log entries (timestamp, level, message); the textbox shows their tail
+        self._log_ring = collections.deque(maxlen=1000)
+        # Lines currently in the textbox; trimmed from LOG_TRIM_AT back to LOG_TRIM_TO
+        self._log_lines = 0
+        # Last formatted log timestamp and the second it was formatted for
+        self._last_ts_sec = 0
+        self._last_ts_str = ""
+        # While the window is unmapped the drainer only fills the ring;
+        # _log_stale marks that the textbox must be rebuilt from it on map
+        self._log_visible = True
+        self._log_stale = False
+
+        # Service state last applied by update_ui_state (None forces a full update)
+        self._last_ui_state = None
+
+        # Fonts shared between widgets, keyed by (size, weight, family)
+        self._fonts = {}
+
         # Create UI
         self.create_widgets()
-
-        # Check if service directory exists
-        self.after(100, self.check_service)
+        # Producers wake the drainer with a virtual event; flush startup messages once
+        self.bind("<<LogReady>>", lambda event: self._drain_log_queue())
+        # Children inherit the toplevel's bindings, so the handlers filter on event.widget
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
+        self.after(50, self._drain_log_queue)
+
+        # Check if service directory exists (off the Tk thread; the disk may be slow).
+        # Started from the main loop so the worker's after() call has a loop to post to.
+        self.after(100, lambda: threading.Thread(target=self.check_service, daemon=True).start())
+
+        # Byte-compile the service while the user reads the UI, so the child's first
+        # import of service/main.py loads cached bytecode instead of compiling it
+        threading.Thread(target=self._prewarm_service, daemon=True).start()
+
+    def _font(self, size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+        """Get a shared CTkFont, creating it on first use"""
+        key = (size, weight, family)
+        font = self._fonts.get(key)
+        if font is None:
+            if family:
+                font = ctk.CTkFont(family=family, size=size, weight=weight)
+            else:
+                font = ctk.CTkFont(size=size, weight=weight)
+            self._fonts[key] = font
+        return font
 
     def create_widgets(self):
         # Configure grid
@@ -287,75 +597,68 @@ class LighterSigningServiceGUI(ctk.CTk):
         self.grid_rowconfigure(1, weight=1)
 
         # Header Frame
-        self.header_frame = ctk.CTkFrame(self, corner_radius=0, fg_color=("gray90", "gray10"))
+        self.header_frame = ctk.CTkFrame(self, corner_radius=0, fg_color=BAR_BG)
         self.header_frame.grid(row=0, column=0, sticky="ew", padx=0, pady=0)
-        self.header_frame.grid_columnconfigure(0, weight=1)
-        self.header_frame.grid_columnconfigure(1, weight=0)
+        # Columns: logo, title, title accent, spacer, theme button
+        self.header_frame.grid_columnconfigure(3, weight=1)
 
         # Logo and Title
-        title_frame = ctk.CTkFrame(self.header_frame, fg_color="transparent")
-        title_frame.grid(row=0, column=0, padx=20, pady=20, sticky="w")
+        title_padx = 20
 
-        # Load and display logo
+        # Load and display logo (same decoded image for both appearance modes)
         try:
-            if getattr(sys, 'frozen', False):
-                if hasattr(sys, '_MEIPASS'):
-                    logo_path = Path(sys._MEIPASS) / "logo.png"
-                else:
-                    logo_path = Path(sys.executable).parent / "logo.png"
-            else:
-                logo_path = Path(__file__).parent / "logo.png"
-
-            if logo_path.exists():
+            logo = load_logo_image()
+            if logo is not None:
                 logo_image = ctk.CTkImage(
-                    light_image=Image.open(logo_path),
-                    dark_image=Image.open(logo_path),
+                    light_image=logo,
+                    dark_image=logo,
                     size=(48, 48)
                 )
-                logo_label = ctk.CTkLabel(title_frame, image=logo_image, text="")
-                logo_label.pack(side="left", padx=(0, 15))
+                logo_label = ctk.CTkLabel(self.header_frame, image=logo_image, text="")
+                logo_label.grid(row=0, column=0, padx=(20, 15), pady=20)
+                title_padx = 0
         except Exception as e:
             print(f"Could not load logo: {e}")
 
         self.title_label = ctk.CTkLabel(
-            title_frame,
+            self.header_frame,
             text="专业交易 ",
-            font=ctk.CTkFont(size=32, weight="bold"),
-            text_color=("gray10", "white")
+            font=self._font(32, "bold"),
+            text_color=TEXT_PRIMARY
         )
-        self.title_label.pack(side="left")
+        self.title_label.grid(row=0, column=1, padx=(title_padx, 0), pady=20, sticky="w")
 
         self.title_label_accent = ctk.CTkLabel(
-            title_frame,
+            self.header_frame,
             text="插件套件",
-            font=ctk.CTkFont(size=32, weight="bold"),
-            text_color=("#818CF8", "#818CF8")
+            font=self._font(32, "bold"),
+            text_color=ACCENT
         )
-        self.title_label_accent.pack(side="left")
+        self.title_label_accent.grid(row=0, column=2, pady=20, sticky="w")
 
         self.subtitle_label = ctk.CTkLabel(
             self.header_frame,
             text="选择适合您的交易策略插件，开启智能化交易之旅",
-            font=ctk.CTkFont(size=14),
+            font=self._font(14),
             text_color=("gray60", "gray60")
         )
-        self.subtitle_label.grid(row=1, column=0, padx=20, pady=(0, 20), sticky="w")
+        self.subtitle_label.grid(row=1, column=0, columnspan=4, padx=20, pady=(0, 20), sticky="w")
 
         # Theme toggle button
         self.theme_button = ctk.CTkButton(
             self.header_frame,
             text="☀️ Light",
             command=self.toggle_theme,
-            font=ctk.CTkFont(size=14),
+            font=self._font(14),
             width=100,
             height=35,
             fg_color="transparent",
             border_width=2,
-            border_color=("#818CF8", "#818CF8"),
-            text_color=("#818CF8", "#818CF8"),
+            border_color=ACCENT,
+            text_color=ACCENT,
             hover_color=("gray85", "gray20")
         )
-        self.theme_button.grid(row=0, column=1, padx=20, pady=20, sticky="e")
+        self.theme_button.grid(row=0, column=4, padx=20, pady=20, sticky="e")
 
 
 
@@ -371,71 +674,44 @@ class LighterSigningServiceGUI(ctk.CTk):
         # Configure 3 columns with equal weight
         self.service_cards_frame.grid_columnconfigure((0, 1, 2), weight=1)
 
-        # Strategy configurations - all with same badge color
-        strategies = [
-            {
-                "name": "Lighter-EdgeX [002]",
-                "desc": "结合两大核心插件优势，提供超低磨损率，是追求稳定高收益的最佳选择",
-                "wear_rate": "磨损率 0.023% - 0.025%",
-                "badge": "已上线",
-                "badge_color": ("#52C41A", "#52C41A")  # Green for all
-            },
-            {
-                "name": "Lighter-Based [003]",
-                "desc": "基于 Based 协议的策略，平衡收益与风险，支持大部分 token",
-                "wear_rate": "磨损率 0.02% - 0.023%",
-                "badge": "已上线",
-                "badge_color": ("#52C41A", "#52C41A")  # Green for all
-            },
-            {
-                "name": "Lighter-Backpack [005]",
-                "desc": "集成 Backpack 生态，灵活的磨损率范围适应不同市场环境，支持大部分 token",
-                "wear_rate": "磨损率 0.014% - 0.035%",
-                "badge": "已上线",
-                "badge_color": ("#52C41A", "#52C41A")  # Green for all
-            }
-        ]
-
         # Create cards for each strategy in horizontal layout
-        for idx, strategy in enumerate(strategies):
-            self.create_strategy_card(self.service_cards_frame, strategy, idx, column=idx)
+        for column, strategy in enumerate(STRATEGIES):
+            card = StrategyCard(self.service_cards_frame, strategy, self._font)
+            card.grid(row=0, column=column, sticky="nsew", padx=(0 if column == 0 else 5, 0 if column == 2 else 5), pady=0)
 
         # Status indicator at bottom (shared across all strategies) - span all columns
         status_info_frame = ctk.CTkFrame(self.service_cards_frame, fg_color="transparent")
         status_info_frame.grid(row=1, column=0, columnspan=3, sticky="ew", padx=0, pady=(10, 0))
 
-        status_icon_frame = ctk.CTkFrame(status_info_frame, fg_color="transparent")
-        status_icon_frame.pack(side="left")
-
         self.status_indicator = ctk.CTkLabel(
-            status_icon_frame,
+            status_info_frame,
             text="●",
-            font=ctk.CTkFont(size=20),
-            text_color=("#FF4D4F", "#FF4D4F")
+            font=self._font(20),
+            text_color=DANGER
         )
         self.status_indicator.pack(side="left", padx=(0, 8))
 
         self.status_text = ctk.CTkLabel(
             status_info_frame,
             text="服务未运行",
-            font=ctk.CTkFont(size=14),
-            text_color=("gray40", "gray70")
+            font=self._font(14),
+            text_color=TEXT_SUBTLE
         )
         self.status_text.pack(side="left")
 
         self.version_label = ctk.CTkLabel(
             status_info_frame,
             text=f"v{APP_VERSION}",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=("#818CF8", "#818CF8")
+            font=self._font(13, "bold"),
+            text_color=ACCENT
         )
         self.version_label.pack(side="right", padx=(0, 10))
 
         self.port_label = ctk.CTkLabel(
             status_info_frame,
             text=f"Port: {self.service_port}",
-            font=ctk.CTkFont(size=13),
-            text_color=("gray50", "gray60")
+            font=self._font(13),
+            text_color=TEXT_MUTED
         )
         self.port_label.pack(side="right", padx=10)
 
@@ -449,11 +725,11 @@ class LighterSigningServiceGUI(ctk.CTk):
             self.control_frame,
             text="▶  启动服务",
             command=self.start_service,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             height=50,
             corner_radius=10,
-            fg_color=("#52C41A", "#52C41A"),
-            hover_color=("#389E0D", "#389E0D"),
+            fg_color=SUCCESS_GREEN,
+            hover_color=SUCCESS_HOVER,
             border_width=0
         )
         self.start_button.grid(row=0, column=0, padx=10, pady=20, sticky="ew")
@@ -463,11 +739,11 @@ class LighterSigningServiceGUI(ctk.CTk):
             self.control_frame,
             text="■  停止服务",
             command=self.stop_service,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=self._font(16, "bold"),
             height=50,
             corner_radius=10,
-            fg_color=("#FF4D4F", "#FF4D4F"),
-            hover_color=("#CF1322", "#CF1322"),
+            fg_color=DANGER,
+            hover_color=DANGER_HOVER,
             border_width=0,
             state="disabled"
         )
@@ -477,24 +753,20 @@ class LighterSigningServiceGUI(ctk.CTk):
         self.address_frame = ctk.CTkFrame(
             self.main_frame,
             corner_radius=15,
-            fg_color=("gray95", "gray15"),
-            border_width=1,
-            border_color=("gray80", "gray25")
+            fg_color=CARD_BG,
+            border_width=0  # Set apart by CARD_BG; a border forces CTk's costlier redraw path
         )
         self.address_frame.grid(row=2, column=0, sticky="ew", padx=20, pady=(0, 10))
         self.address_frame.grid_columnconfigure(0, weight=1)
 
         # Section Header
-        address_header = ctk.CTkFrame(self.address_frame, fg_color="transparent")
-        address_header.grid(row=0, column=0, sticky="ew", padx=15, pady=(10, 5))
-
         address_title = ctk.CTkLabel(
-            address_header,
+            self.address_frame,
             text="📡 服务访问地址",
-            font=ctk.CTkFont(size=13, weight="bold"),
-            text_color=("gray10", "white")
+            font=self._font(13, "bold"),
+            text_color=TEXT_PRIMARY
         )
-        address_title.pack(side="left")
+        address_title.grid(row=0, column=0, sticky="w", padx=15, pady=(10, 5))
 
         # Chrome Browser Address
         chrome_container = ctk.CTkFrame(self.address_frame, fg_color="transparent")
@@ -504,16 +776,16 @@ class LighterSigningServiceGUI(ctk.CTk):
         chrome_icon_label = ctk.CTkLabel(
             chrome_container,
             text="🌐 Chrome浏览器:",
-            font=ctk.CTkFont(size=11),
-            text_color=("gray30", "gray80")
+            font=self._font(11),
+            text_color=TEXT_SECONDARY
         )
         chrome_icon_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
 
         self.localhost_address = ctk.CTkLabel(
             chrome_container,
             text=f"http://localhost:{self.service_port}",
-            font=ctk.CTkFont(size=11, family="Monaco"),
-            text_color=("#818CF8", "#818CF8")
+            font=self._font(11, family="Monaco"),
+            text_color=ACCENT
         )
         self.localhost_address.grid(row=0, column=1, sticky="w")
 
@@ -521,12 +793,12 @@ class LighterSigningServiceGUI(ctk.CTk):
             chrome_container,
             text="复制",
             command=lambda: self.copy_address(f"http://localhost:{self.service_port}"),
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             width=45,
             height=22,
             corner_radius=5,
-            fg_color=("#818CF8", "#818CF8"),
-            hover_color=("#6366F1", "#6366F1")
+            fg_color=ACCENT,
+            hover_color=ACCENT_HOVER
         )
         self.copy_localhost_btn.grid(row=0, column=2, padx=(8, 0))
 
@@ -538,8 +810,8 @@ class LighterSigningServiceGUI(ctk.CTk):
         fingerprint_icon_label = ctk.CTkLabel(
             fingerprint_container,
             text="🎭 指纹浏览器:",
-            font=ctk.CTkFont(size=11),
-            text_color=("gray30", "gray80")
+            font=self._font(11),
+            text_color=TEXT_SECONDARY
         )
         fingerprint_icon_label.grid(row=0, column=0, sticky="w", padx=(0, 8))
 
@@ -547,8 +819,8 @@ class LighterSigningServiceGUI(ctk.CTk):
         self.lan_address_label = ctk.CTkLabel(
             fingerprint_container,
             text=lan_address,
-            font=ctk.CTkFont(size=11, family="Monaco"),
-            text_color=("#52C41A", "#52C41A") if self.local_ip != "Unable to detect" else ("#FF4D4F", "#FF4D4F")
+            font=self._font(11, family="Monaco"),
+            text_color=SUCCESS_GREEN if self.local_ip != "Unable to detect" else DANGER
         )
         self.lan_address_label.grid(row=0, column=1, sticky="w")
 
@@ -556,12 +828,12 @@ class LighterSigningServiceGUI(ctk.CTk):
             fingerprint_container,
             text="复制",
             command=lambda: self.copy_address(lan_address),
-            font=ctk.CTkFont(size=10),
+            font=self._font(10),
             width=45,
             height=22,
             corner_radius=5,
-            fg_color=("#52C41A", "#52C41A"),
-            hover_color=("#389E0D", "#389E0D"),
+            fg_color=SUCCESS_GREEN,
+            hover_color=SUCCESS_HOVER,
             state="normal" if self.local_ip != "Unable to detect" else "disabled"
         )
         self.copy_lan_btn.grid(row=0, column=2, padx=(8, 0))
@@ -570,8 +842,8 @@ class LighterSigningServiceGUI(ctk.CTk):
         hint_text = ctk.CTkLabel(
             self.address_frame,
             text="💡 MoreLogin等指纹浏览器请使用上方IP地址",
-            font=ctk.CTkFont(size=9),
-            text_color=("gray50", "gray60")
+            font=self._font(9),
+            text_color=TEXT_MUTED
         )
         hint_text.grid(row=3, column=0, sticky="w", padx=15, pady=(2, 8))
 
@@ -579,53 +851,18 @@ class LighterSigningServiceGUI(ctk.CTk):
         self.log_frame = ctk.CTkFrame(
             self.main_frame,
             corner_radius=15,
-            fg_color=("gray95", "gray15"),
-            border_width=1,
-            border_color=("gray80", "gray25")
+            fg_color=CARD_BG,
+            border_width=0
         )
         self.log_frame.grid(row=3, column=0, sticky="nsew", padx=20, pady=(10, 20))
         self.log_frame.grid_columnconfigure(0, weight=1)
         self.log_frame.grid_rowconfigure(1, weight=1)
 
-        log_header_frame = ctk.CTkFrame(self.log_frame, fg_color="transparent")
-        log_header_frame.grid(row=0, column=0, sticky="ew", padx=25, pady=(20, 10))
-        log_header_frame.grid_columnconfigure(0, weight=1)
-
-        self.log_title = ctk.CTkLabel(
-            log_header_frame,
-            text="📋 服务日志",
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray10", "white")
-        )
-        self.log_title.pack(side="left")
-
-        self.clear_log_button = ctk.CTkButton(
-            log_header_frame,
-            text="清除日志",
-            command=self.clear_log,
-            font=ctk.CTkFont(size=12),
-            width=80,
-            height=28,
-            corner_radius=8,
-            fg_color="transparent",
-            border_width=1,
-            border_color=("gray70", "gray40"),
-            text_color=("gray40", "gray70"),
-            hover_color=("gray85", "gray25")
-        )
-        self.clear_log_button.pack(side="right")
-
-        self.log_text = ctk.CTkTextbox(
-            self.log_frame,
-            font=ctk.CTkFont(size=11),
-            wrap="word",
-            fg_color=("white", "gray20"),
-            border_width=0
-        )
-        self.log_text.grid(row=1, column=0, padx=25, pady=(5, 25), sticky="nsew")
+        # Header and textbox are built by _build_log_section on the first message
+        self.log_text = None
 
         # Footer
-        self.footer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color=("gray90", "gray10"))
+        self.footer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color=BAR_BG)
         self.footer_frame.grid(row=2, column=0, sticky="ew", padx=0, pady=0)
 
         # Footer with social links
@@ -635,8 +872,8 @@ class LighterSigningServiceGUI(ctk.CTk):
         self.footer_label = ctk.CTkLabel(
             footer_content,
             text="AlphaLabs © 2025 | Signer Manager",
-            font=ctk.CTkFont(size=11),
-            text_color=("gray50", "gray60")
+            font=self._font(11),
+            text_color=TEXT_MUTED
         )
         self.footer_label.pack(side="left", padx=20)
 
@@ -654,77 +891,19 @@ class LighterSigningServiceGUI(ctk.CTk):
             link_btn = ctk.CTkButton(
                 social_links_frame,
                 text=text,
-                font=ctk.CTkFont(size=10),
+                font=self._font(10),
                 width=80,
                 height=24,
                 corner_radius=6,
                 fg_color="transparent",
                 border_width=1,
-                border_color=("gray70", "gray40"),
-                text_color=("gray40", "gray70"),
-                hover_color=("gray85", "gray25"),
+                border_color=GHOST_BORDER,
+                text_color=TEXT_SUBTLE,
+                hover_color=GHOST_HOVER,
                 command=lambda u=url: self.open_link(u)
             )
             link_btn.pack(side="left", padx=5)
 
-    def create_strategy_card(self, parent, strategy, index, column=0):
-        """Create a strategy information card"""
-        card = ctk.CTkFrame(
-            parent,
-            corner_radius=15,
-            fg_color=("gray95", "gray15"),
-            border_width=1,
-            border_color=("gray80", "gray25")
-        )
-        # Place in row 0, different columns for horizontal layout
-        card.grid(row=0, column=column, sticky="nsew", padx=(0 if column == 0 else 5, 0 if column == 2 else 5), pady=0)
-        card.grid_columnconfigure(0, weight=1)
-
-        # Card header
-        card_header = ctk.CTkFrame(card, fg_color="transparent")
-        card_header.grid(row=0, column=0, sticky="ew", padx=25, pady=(15, 8))
-        card_header.grid_columnconfigure(1, weight=1)
-
-        service_title = ctk.CTkLabel(
-            card_header,
-            text=strategy["name"],
-            font=ctk.CTkFont(size=16, weight="bold"),
-            text_color=("gray10", "white")
-        )
-        service_title.grid(row=0, column=0, sticky="w")
-
-        status_badge = ctk.CTkLabel(
-            card_header,
-            text=strategy["badge"],
-            font=ctk.CTkFont(size=11, weight="bold"),
-            text_color="white",
-            fg_color=strategy["badge_color"],
-            corner_radius=10,
-            padx=10,
-            pady=3
-        )
-        status_badge.grid(row=0, column=1, padx=10, sticky="e")
-
-        # Card description
-        service_desc = ctk.CTkLabel(
-            card,
-            text=strategy["desc"],
-            font=ctk.CTkFont(size=11),
-            text_color=("gray50", "gray60"),
-            wraplength=250,  # Reduced for horizontal layout
-            justify="left"
-        )
-        service_desc.grid(row=1, column=0, sticky="w", padx=20, pady=(0, 8))
-
-        # Wear rate
-        wear_rate_label = ctk.CTkLabel(
-            card,
-            text=strategy["wear_rate"],
-            font=ctk.CTkFont(size=12, weight="bold"),
-            text_color=("gray30", "gray80")
-        )
-        wear_rate_label.grid(row=2, column=0, sticky="w", padx=25, pady=(0, 15))
-
     def open_link(self, url):
         """Open URL in default browser"""
         webbrowser.open(url)
@@ -739,65 +918,196 @@ class LighterSigningServiceGUI(ctk.CTk):
         except Exception as e:
             self.log(f"复制失败: {str(e)}", "ERROR")
 
-    def log(self, message: str, level: str = "INFO"):
-        """Add a message to the log with color coding (thread-safe)"""
-        # If called from a different thread, schedule on main thread
-        if threading.current_thread() != threading.main_thread():
-            self.after(0, lambda: self.log(message, level))
-            return
-
-        timestamp = time.strftime("%H:%M:%S")
-
-        # Define colors for different log levels (light mode, dark mode)
-        color_map = {
-            "INFO": ("#666666", "#999999"),
-            "SUCCESS": ("#52C41A", "#52C41A"),
-            "WARNING": ("#FAAD14", "#FAAD14"),
-            "ERROR": ("#FF4D4F", "#FF4D4F"),
-            "SERVICE": ("#818CF8", "#818CF8")  # Purple color
-        }
-
-        # Get current theme
-        current_mode = ctk.get_appearance_mode()
-        color = color_map.get(level, ("#666666", "#999999"))
-        text_color = color[1] if current_mode == "Dark" else color[0]
-        timestamp_color = "#999999" if current_mode == "Dark" else "#999999"
-
-        # Insert timestamp
-        self.log_text.insert("end", f"[{timestamp}] ", "timestamp")
+    def _build_log_section(self):
+        """Create the log header and textbox inside log_frame"""
+        self.log_title = ctk.CTkLabel(
+            self.log_frame,
+            text="📋 服务日志",
+            font=self._font(16, "bold"),
+            text_color=TEXT_PRIMARY
+        )
+        self.log_title.grid(row=0, column=0, sticky="w", padx=(25, 0), pady=(20, 10))
 
-        # Insert level with color
-        self.log_text.insert("end", f"[{level}] ", level)
+        self.clear_log_button = ctk.CTkButton(
+            self.log_frame,
+            text="清除日志",
+            command=self.clear_log,
+            font=self._font(12),
+            width=80,
+            height=28,
+            corner_radius=8,
+            fg_color="transparent",
+            border_width=1,
+            border_color=GHOST_BORDER,
+            text_color=TEXT_SUBTLE,
+            hover_color=GHOST_HOVER
+        )
+        self.clear_log_button.grid(row=0, column=1, sticky="e", padx=(0, 25), pady=(20, 10))
 
-        # Insert message
-        self.log_text.insert("end", f"{message}\n", level)
+        self.log_text = ctk.CTkTextbox(
+            self.log_frame,
+            font=self._font(11),
+            wrap="word",
+            fg_color=("white", "gray20"),
+            border_width=0
+        )
+        self.log_text.grid(row=1, column=0, columnspan=2, padx=25, pady=(5, 25), sticky="nsew")
+        self._configure_log_tags()
+
+    def log_exception(self, level: str = "ERROR"):
+        """Log the exception being handled; the traceback is formatted by the drainer"""
+        self.log(sys.exc_info(), level)
+
+    def log(self, message, level: str = "INFO"):
+        """Add a message to the log with color coding (thread-safe)
+
+        message is normally a string; log_exception passes an exc_info tuple instead.
+        """
+        # Only enqueue here; the Tk main thread writes to the textbox in _drain_log_queue
+        self._log_queue.put((time.time(), level, message))
+        # One wakeup per drain: later messages ride along with the pending one
+        if self._log_wakeup_pending:
+            return
+        self._log_wakeup_pending = True
+        try:
+            self.event_generate("<<LogReady>>", when="tail")
+        except (RuntimeError, tkinter.TclError):
+            # Window already destroyed (or main loop gone); nothing left to show it in.
+            # No wakeup was queued, so let the next log() try again
+            self._log_wakeup_pending = False
+
+    def _drain_log_queue(self):
+        """Write pending log messages to the textbox in one batch (Tk main thread only)"""
+        # Clear before draining so a message queued from here on raises a new wakeup
+        self._log_wakeup_pending = False
+        ring = self._log_ring
+        visible = self._log_visible
+        segments = []
+        added_lines = 0
+        try:
+            for _ in range(500):
+                created, level, message = self._log_queue.get_nowait()
+                # Format each wall-clock second once; bursts share the same string
+                second = int(created)
+                if second != self._last_ts_sec:
+                    self._last_ts_sec = second
+                    self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(second))
+                timestamp = self._last_ts_str
+                if not isinstance(message, str):
+                    # Deferred traceback from log_exception
+                    message = "".join(traceback.format_exception(*message)).rstrip()
+                if visible:
+                    segments += self._log_segments(timestamp, level, message)
+                    added_lines += message.count("\n") + 1
+                else:
+                    # Window is hidden: only keep the ring, _on_map redraws from it
+                    self._log_stale = True
+                ring.append((timestamp, level, message))
+        except queue.Empty:
+            pass
 
-        # Configure tags for colors
-        self.log_text.tag_config("timestamp", foreground=timestamp_color)
-        self.log_text.tag_config(level, foreground=text_color)
+        if segments:
+            if self.log_text is None:
+                self._build_log_section()
+
+            # Insert all timestamps, levels and messages in a single Tk call
+            # (CTkTextbox.insert only forwards one text/tag pair, so use the inner tk Text)
+            self.log_text._textbox.insert("end", *segments)
+
+            # Auto-scroll to bottom
+            self.log_text.see("end")
+
+            # Trim in one delete with headroom, so a full log is not trimmed on every batch
+            self._log_lines += added_lines
+            if self._log_lines > LOG_TRIM_AT:
+                excess = self._log_lines - LOG_TRIM_TO
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+                self._log_lines -= excess
+
+        # More than one batch was waiting; continue once Tk has caught up on redraws
+        if not self._log_queue.empty():
+            self.after_idle(self._drain_log_queue)
+
+    @staticmethod
+    def _log_segments(timestamp: str, level: str, message: str) -> tuple:
+        """Text/tag pairs for one log entry, for a multi-segment Text insert"""
+        return (
+            f"[{timestamp}] ", ("timestamp",),
+            f"[{level}] ", (level,),
+            f"{message}\n", (level,)
+        )
 
-        # Auto-scroll to bottom
-        self.log_text.see("end")
+    def _on_unmap(self, event):
+        """Stop writing to the textbox while the window is minimized"""
+        if event.widget is self:
+            self._log_visible = False
 
-        # Limit log size (keep last 1000 lines)
-        lines = self.log_text.get("1.0", "end").split("\n")
-        if len(lines) > 1000:
-            self.log_text.delete("1.0", f"{len(lines) - 1000}.0")
+    def _on_map(self, event):
+        """Redraw the textbox from the ring if messages arrived while hidden"""
+        if event.widget is not self:
+            return
+        self._log_visible = True
+        if self._log_stale:
+            self._log_stale = False
+            if self.log_text is None:
+                self._build_log_section()
+            segments = []
+            lines = 0
+            for entry in self._log_ring:
+                segments += self._log_segments(*entry)
+                lines += entry[2].count("\n") + 1
+            self._log_lines = lines
+            self.log_text.delete("1.0", "end")
+            if segments:
+                self.log_text._textbox.insert("end", *segments)
+            self.log_text.see("end")
+        self._drain_log_queue()
+
+    def _configure_log_tags(self):
+        """Configure log tag colors for the current appearance mode"""
+        if self.log_text is None:
+            return
+        mode_index = 1 if ctk.get_appearance_mode() == "Dark" else 0
+        self.log_text.tag_config("timestamp", foreground=LOG_TIMESTAMP_COLOR)
+        for level, colors in LOG_LEVEL_COLORS.items():
+            self.log_text.tag_config(level, foreground=colors[mode_index])
 
     def clear_log(self):
         """Clear all log messages"""
+        self._log_ring.clear()
+        self._log_lines = 0
+        self._log_stale = False
         self.log_text.delete("1.0", "end")
         self.log("Log cleared", "INFO")
 
+    def _scan_service_dir(self) -> bool:
+        """Check for service/main.py with one directory read and remember the result"""
+        try:
+            with os.scandir(self.service_dir) as entries:
+                found = any(entry.name == "main.py" for entry in entries)
+        except OSError:
+            found = False
+        self._service_ok = found
+        return found
+
     def check_service(self):
-        """Check if the service directory exists"""
-        if self.service_dir.exists() and (self.service_dir / "main.py").exists():
+        """Check if the service directory exists (runs in a worker thread)"""
+        if self._scan_service_dir():
             self.log("Service found and ready", "SUCCESS")
             self.log(f"Service location: {self.service_dir}", "INFO")
         else:
             self.log("ERROR: Service files not found!", "ERROR")
             self.log(f"Expected location: {self.service_dir}", "ERROR")
-            self.start_button.configure(state="disabled")
+            # Widgets may only be touched from the Tk thread
+            self.after(0, lambda: self.start_button.configure(state="disabled"))
+
+    def _prewarm_service(self):
+        """Write __pycache__ bytecode for the service modules (runs in a worker thread)"""
+        try:
+            compileall.compile_dir(str(self.service_dir), maxlevels=0, quiet=2)
+        except Exception:
+            # Read-only install or similar; the child just compiles on import as before
+            pass
 
     def start_service(self):
         """Start the HTTP service"""
@@ -808,6 +1118,8 @@ class LighterSigningServiceGUI(ctk.CTk):
         # Update UI immediately to show we're starting
         self.log("Starting service...", "INFO")
         self.start_button.configure(state="disabled", text="启动中...")
+        # The start button no longer matches the cached state, so let update_ui_state redo it
+        self._last_ui_state = None
 
         def start_task():
             try:
@@ -823,16 +1135,14 @@ class LighterSigningServiceGUI(ctk.CTk):
                             self.log(f"Found process {pid} using port {self.service_port}", "INFO")
                             if kill_process_on_port(self.service_port):
                                 self.log("Old process terminated successfully", "SUCCESS")
-                                # Wait a bit more to ensure port is released
-                                time.sleep(2)
                             else:
                                 self.log("Failed to terminate old process", "ERROR")
                                 self.log("Please manually close the application using port 10000", "ERROR")
                                 self.start_button.configure(state="normal", text="启动服务")
                                 return
 
-                    # Double check port is now free
-                    if is_port_in_use(self.service_port):
+                    # Wait for the port to be released, returning as soon as it is free
+                    if not wait_for_port_release(self.service_port):
                         self.log(f"Port {self.service_port} is still in use!", "ERROR")
                         self.log("Please wait 2 minutes or restart your computer", "ERROR")
                         self.start_button.configure(state="normal", text="启动服务")
@@ -842,116 +1152,54 @@ class LighterSigningServiceGUI(ctk.CTk):
                 else:
                     self.log(f"Port {self.service_port} is available", "SUCCESS")
 
-                # Import uvicorn and the service app
-                import importlib.util
-                import uvicorn
-
-                # Add service directory to path
-                service_path = str(self.service_dir)
-                if service_path not in sys.path:
-                    sys.path.insert(0, service_path)
-
-                # Import the service main module
-                main_file = self.service_dir / "main.py"
-                if not main_file.exists():
+                # Only hit the disk again if the service was not already found
+                if not self._service_ok and not self._scan_service_dir():
                     self.log("Service main.py not found", "ERROR")
                     self.start_button.configure(state="normal", text="启动服务")
                     return
 
                 self.log("Loading service dependencies (this may take a moment on first run)...", "INFO")
 
-                # Load the service module
-                spec = importlib.util.spec_from_file_location("service_main", main_file)
-                if spec is None or spec.loader is None:
-                    self.log("Failed to load service module", "ERROR")
-                    self.start_button.configure(state="normal", text="启动服务")
-                    return
-
-                service_module = importlib.util.module_from_spec(spec)
-                sys.modules["service_main"] = service_module
-
-                # Execute the service module to get the FastAPI app (this is slow on first run)
-                try:
-                    spec.loader.exec_module(service_module)
-                except Exception as exec_error:
-                    self.log(f"Service module load error: {str(exec_error)}", "ERROR")
-                    self.log(traceback.format_exc(), "ERROR")
-                    self.start_button.configure(state="normal", text="启动服务")
-                    return
-
-                # Get the FastAPI app from the module
-                if not hasattr(service_module, 'app'):
-                    self.log("Service module does not have 'app' attribute", "ERROR")
-                    self.start_button.configure(state="normal", text="启动服务")
-                    return
-
-                app = service_module.app
+                # Run the service in its own process so uvicorn never competes with Tk for the GIL
+                process = subprocess.Popen(
+                    get_service_command(self.service_port),
+                    cwd=str(self.service_dir),
+                    stdin=subprocess.PIPE,  # closed by stop_service to request shutdown
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    bufsize=1,
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                )
 
+                self.service_process = process
                 self.service_running = True
                 self.update_ui_state()
-                self.log(f"Service starting on port {self.service_port}...", "INFO")
+                self.log(f"Service started on port {self.service_port} (PID {process.pid})", "SUCCESS")
 
-                # Start uvicorn server
+                # Forward service output to the log until the process exits
                 try:
-                    # Configure logging before redirecting stdout/stderr
-                    # This prevents "AttributeError: 'NoneType' object has no attribute 'write'" on Windows
-                    logging.getLogger('asyncio').setLevel(logging.WARNING)
-
-                    # Ensure root logger handlers are configured
-                    for handler in logging.root.handlers[:]:
-                        logging.root.removeHandler(handler)
-
-                    # Redirect stdout/stderr to capture all output
-                    old_stdout = sys.stdout
-                    old_stderr = sys.stderr
-
                     stream_logger = StreamToLogger(self.log, "SERVICE")
-                    sys.stdout = stream_logger
-                    sys.stderr = stream_logger
-
-                    try:
-                        # On Windows, we need to set the event loop policy explicitly
-                        # to avoid issues with ProactorEventLoop in packaged apps
-                        if sys.platform == 'win32':
-                            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-                        config = uvicorn.Config(
-                            app=app,
-                            host="0.0.0.0",
-                            port=self.service_port,
-                            log_level="info",
-                            access_log=True,
-                            timeout_graceful_shutdown=1,  # Fast shutdown to release port quickly
-                            limit_concurrency=100,
-                            backlog=50
-                        )
-                        self.uvicorn_server = uvicorn.Server(config)
-
-                        self.log(f"Service started on port {self.service_port}", "SUCCESS")
-
-                        # Create and run event loop manually for better Windows compatibility
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        try:
-                            loop.run_until_complete(self.uvicorn_server.serve())
-                        finally:
-                            loop.close()
-                    finally:
-                        # Restore stdout/stderr
-                        sys.stdout = old_stdout
-                        sys.stderr = old_stderr
-
-                except Exception as server_error:
-                    self.log(f"Server error: {str(server_error)}", "ERROR")
-                    self.log(traceback.format_exc(), "ERROR")
+                    for line in process.stdout:
+                        stream_logger.write(line)
+                    returncode = process.wait()
                 finally:
-                    self.service_running = False
-                    self.update_ui_state()
-                    self.log("Service stopped", "INFO")
+                    # stop_service may already have reset the state (or a new service started)
+                    if self.service_process is process:
+                        self.service_running = False
+                        self.service_process = None
+
+                # A service killed after an explicit stop exits nonzero; that is expected
+                if returncode and self._stop_requested is not process:
+                    self.log(f"Service exited with code {returncode}", "WARNING")
+                self.update_ui_state()
+                self.log("Service stopped", "INFO")
 
             except Exception as e:
                 self.log(f"Failed to start service: {str(e)}", "ERROR")
-                self.log(traceback.format_exc(), "ERROR")
+                self.log_exception()
                 self.service_running = False
                 self.service_process = None
                 self.start_button.configure(state="normal", text="启动服务")
@@ -959,89 +1207,128 @@ class LighterSigningServiceGUI(ctk.CTk):
 
         threading.Thread(target=start_task, daemon=True).start()
 
-    def stop_service(self):
-        """Stop the HTTP service"""
+    def stop_service(self, on_stopped=None):
+        """Stop the HTTP service; on_stopped is called on the Tk thread once it has exited"""
         if not self.service_running:
             self.log("Service is not running", "WARNING")
             return
+        if on_stopped:
+            self._on_stopped = on_stopped
+        if self._stopping:
+            # Already waiting for the process; on_stopped runs when that wait ends
+            return
 
         try:
             self.log("Stopping service...", "INFO")
+            self._stopping = True
 
-            # Signal the server to stop
-            if self.uvicorn_server:
-                self.uvicorn_server.should_exit = True
-                self.uvicorn_server.force_exit = True
+            # Ask the service process to exit by closing its stdin (see run_service);
+            # _await_shutdown kills it if it does not
+            process = self.service_process
+            self._stop_requested = process
+            if process and process.poll() is None:
+                try:
+                    process.stdin.close()
+                except OSError:
+                    pass
+            deadline = time.monotonic() + self.shutdown_grace_ms / 1000
+            self.after(self.shutdown_poll_ms, self._await_shutdown, process, deadline, False)
 
-                # Wait for server to gracefully shutdown (reduced timeout)
-                max_wait = 1.0  # seconds (reduced from 5)
-                waited = 0
-                while waited < max_wait:
-                    if not is_port_in_use(self.service_port):
-                        break
-                    time.sleep(0.1)  # Check more frequently (reduced from 0.5)
-                    waited += 0.1
+        except Exception as e:
+            self._stopping = False
+            self.log(f"Error stopping service: {str(e)}", "ERROR")
+
+    def _await_shutdown(self, process, deadline, killed):
+        """Poll the stopping service from the Tk event loop instead of blocking it"""
+        try:
+            if process and process.poll() is None:
+                if time.monotonic() < deadline:
+                    self.after(self.shutdown_poll_ms, self._await_shutdown, process, deadline, killed)
+                    return
+                if not killed:
+                    # Grace period is over: kill it and allow a short final wait
+                    self.log("Service did not exit in time, killing it", "WARNING")
+                    process.kill()
+                    self.after(self.shutdown_poll_ms, self._await_shutdown,
+                               process, time.monotonic() + 0.5, True)
+                    return
 
             self.service_running = False
-            self.service_process = None
-            self.uvicorn_server = None
+            if self.service_process is process:
+                self.service_process = None
             self.update_ui_state()
 
-            # Verify port is released
-            if is_port_in_use(self.service_port):
-                self.log(f"Warning: Port {self.service_port} may still be in use", "WARNING")
-                self.log("Please wait a moment before restarting", "WARNING")
-            else:
-                self.log("Service stopped successfully", "SUCCESS")
+            # Let the state change render first; the bind() probe runs on a later tick
+            self.after(100, self._verify_port_released)
 
         except Exception as e:
             self.log(f"Error stopping service: {str(e)}", "ERROR")
 
+        self._stopping = False
+        on_stopped, self._on_stopped = self._on_stopped, None
+        if on_stopped:
+            on_stopped()
+
+    def _verify_port_released(self):
+        """Report whether the stopped service has released its port"""
+        if is_port_in_use(self.service_port):
+            self.log(f"Warning: Port {self.service_port} may still be in use", "WARNING")
+            self.log("Please wait a moment before restarting", "WARNING")
+        else:
+            self.log("Service stopped successfully", "SUCCESS")
+
     def update_ui_state(self):
         """Update UI elements based on service state"""
-        if self.service_running:
-            self.status_indicator.configure(
-                text="●",
-                text_color=("#52C41A", "#52C41A")
-            )
-            self.status_text.configure(text="服务运行中")
-            self.start_button.configure(state="disabled", text="✓  已启动")
-            self.stop_button.configure(state="normal")
-        else:
-            self.status_indicator.configure(
-                text="●",
-                text_color=("#FF4D4F", "#FF4D4F")
-            )
-            self.status_text.configure(text="服务未运行")
-            self.start_button.configure(state="normal", text="▶  启动服务")
-            self.stop_button.configure(state="disabled")
+        running = self.service_running
+        if running == self._last_ui_state:
+            return
+
+        options = UI_RUNNING if running else UI_STOPPED
+        self._configure_changed(self.status_indicator, **options["indicator"])
+        self._configure_changed(self.status_text, **options["status"])
+        self._configure_changed(self.start_button, **options["start"])
+        self._configure_changed(self.stop_button, **options["stop"])
+
+        self._last_ui_state = running
+
+    @staticmethod
+    def _configure_changed(widget, **options):
+        """Configure only the options that differ, since each configure redraws the widget"""
+        changed = {key: value for key, value in options.items() if widget.cget(key) != value}
+        if changed:
+            widget.configure(**changed)
 
     def on_closing(self):
         """Handle window closing"""
         if self.service_running:
             self.log("Stopping service before exit...", "INFO")
-            self.stop_service()
-
-            # Force kill if still running (Windows only)
-            if sys.platform == 'win32' and is_port_in_use(self.service_port):
-                self.log("Force terminating service...", "WARNING")
-                kill_process_on_port(self.service_port)
-                time.sleep(0.5)
-
+            # Keep the window alive (and responsive) until the service has exited
+            self.stop_service(on_stopped=self._finish_closing)
+        else:
+            self.destroy()
+
+    def _finish_closing(self):
+        """Destroy the window once the service is down"""
+        # Force kill if still running (Windows only)
+        if sys.platform == 'win32' and is_port_in_use(self.service_port):
+            self.log("Force terminating service...", "WARNING")
+            kill_process_on_port(self.service_port)
         self.destroy()
 
     def toggle_theme(self):
         """Toggle between light and dark theme"""
-        if self.current_theme == "dark":
-            self.current_theme = "light"
-            ctk.set_appearance_mode("light")
-            self.theme_button.configure(text="🌙 Dark")
-            self.log("Switched to light theme", "INFO")
-        else:
-            self.current_theme = "dark"
-            ctk.set_appearance_mode("dark")
-            self.theme_button.configure(text="☀️ Light")
-            self.log("Switched to dark theme", "INFO")
+        self.set_theme(THEME_TOGGLE[self.current_theme])
+
+    def set_theme(self, theme: str):
+        """Switch to the given theme ("dark" or "light"); no-op if already active"""
+        if theme == self.current_theme:
+            return
+        button_text, message = THEMES[theme]
+        self.current_theme = theme
+        ctk.set_appearance_mode(theme)
+        self._configure_log_tags()
+        self.theme_button.configure(text=button_text)
+        self.log(message, "INFO")
 
 
 def check_single_instance():
@@ -1049,7 +1336,6 @@ def check_single_instance():
     Check if another instance is already running
     Returns True if this is the only instance, False otherwise
     """
-    import tempfile
     lock_file = Path(tempfile.gettempdir()) / "alphalabs_signer.lock"
 
     try:
@@ -1061,7 +1347,6 @@ def check_single_instance():
                     old_pid = int(f.read().strip())
 
                 # Check if process with that PID is still running
-                import psutil
                 if psutil.pid_exists(old_pid):
                     try:
                         proc = psutil.Process(old_pid)
@@ -1091,7 +1376,6 @@ def check_single_instance():
 
 def cleanup_lock_file():
     """Remove lock file on exit"""
-    import tempfile
     lock_file = Path(tempfile.gettempdir()) / "alphalabs_signer.lock"
     try:
         if lock_file.exists():
@@ -1102,6 +1386,11 @@ def cleanup_lock_file():
 
 def main():
     """Main entry point"""
+    # Child process started by the GUI to host the signing service
+    if len(sys.argv) > 2 and sys.argv[1] == SERVICE_ARG:
+        run_service(int(sys.argv[2]))
+        return
+
     # Check if another instance is already running
     if not check_single_instance():
         import tkinter.messagebox as messagebox
@@ -1118,7 +1407,6 @@ def main():
         return
 
     # Register cleanup on exit
-    import atexit
     atexit.register(cleanup_lock_file)
 
     try:
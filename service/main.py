@@ -1,57 +1,86 @@
-from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional, Dict
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+from typing import Annotated, Literal, Union
+import concurrent.futures
 import ctypes
+import hashlib
+import operator
 import platform
 import os
-import json
 import logging
+import orjson
 import asyncio
-from collections import defaultdict
-from eth_account import Account
-from eth_account.messages import encode_defunct
-from starlette.middleware.base import BaseHTTPMiddleware
+import threading
+from collections import OrderedDict
+import coincurve
+from eth_utils import keccak
 
 # Import nonce manager
 from service.nonce_manager import nonce_manager
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Version number - update this for each release
 VERSION = "0.1.4"
 
 app = FastAPI(
-    title="Lighter Signing Service (Thread-Safe with Global Lock)",
+    title="Lighter Signing Service (Thread-Safe with Single Signer Thread)",
     version=VERSION,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
 
 
+# CORS headers are constant, so encode them once
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"*"),
+    (b"access-control-allow-headers", b"*"),
+]
+CORS_PREFLIGHT_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": CORS_HEADERS + [
+        (b"access-control-max-age", b"3600"),
+        (b"content-length", b"0"),
+    ],
+}
+CORS_PREFLIGHT_BODY = {"type": "http.response.body", "body": b""}
+CORS_HEADER_NAMES = {name for name, _ in CORS_HEADERS}
+
+
 # Custom CORS middleware to ensure headers are added
-class CustomCORSMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        # Handle preflight requests
-        if request.method == "OPTIONS":
-            response = Response()
-            response.status_code = 200
-            response.headers["Access-Control-Allow-Origin"] = "*"
-            response.headers["Access-Control-Allow-Methods"] = "*"
-            response.headers["Access-Control-Allow-Headers"] = "*"
-            response.headers["Access-Control-Max-Age"] = "3600"
-            return response
+# Plain ASGI rather than BaseHTTPMiddleware, which wraps every request in extra
+# Request/Response objects and an anyio task
+class CustomCORSMiddleware:
+    def __init__(self, app):
+        self.app = app
 
-        # Process regular requests
-        response = await call_next(request)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Add CORS headers to response
-        response.headers["Access-Control-Allow-Origin"] = "*"
-        response.headers["Access-Control-Allow-Methods"] = "*"
-        response.headers["Access-Control-Allow-Headers"] = "*"
+        # Handle preflight requests
+        if scope["method"] == "OPTIONS":
+            await send(CORS_PREFLIGHT_START)
+            await send(CORS_PREFLIGHT_BODY)
+            return
+
+        # Process regular requests, adding CORS headers to the response
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = [
+                    header for header in message.get("headers", [])
+                    if header[0].lower() not in CORS_HEADER_NAMES
+                ]
+                message["headers"] = headers + CORS_HEADERS
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_cors)
 
 
 # Add custom CORS middleware
@@ -61,18 +90,18 @@ app.add_middleware(CustomCORSMiddleware)
 @app.on_event("startup")
 async def startup_event():
     """Check if signer is initialized on startup"""
-    logging.info("=" * 60)
-    logging.info("Service starting up...")
-    logging.info(f"CORS middleware enabled: allow_origins=['*'], allow_methods=['*']")
-    logging.info("=" * 60)
+    logger.info("=" * 60)
+    logger.info("Service starting up...")
+    logger.info("CORS middleware enabled: allow_origins=['*'], allow_methods=['*']")
+    logger.info("=" * 60)
     if signer is None:
-        logging.error("=" * 60)
-        logging.error("CRITICAL: Signer failed to initialize!")
-        logging.error(f"Platform: {platform.system()}/{platform.machine()}")
-        logging.error("The service will start but signing operations will fail.")
-        logging.error("=" * 60)
+        logger.error("=" * 60)
+        logger.error("CRITICAL: Signer failed to initialize!")
+        logger.error("Platform: %s/%s", platform.system(), platform.machine())
+        logger.error("The service will start but signing operations will fail.")
+        logger.error("=" * 60)
     else:
-        logging.info(f"Signer initialized successfully on {platform.system()}/{platform.machine()}")
+        logger.info("Signer initialized successfully on %s/%s", platform.system(), platform.machine())
 
 
 class ApiKeyResponse(ctypes.Structure):
@@ -83,6 +112,86 @@ class StrOrErr(ctypes.Structure):
     _fields_ = [("str", ctypes.c_char_p), ("err", ctypes.c_char_p)]
 
 
+def read_str_or_err(result: StrOrErr) -> tuple[str | None, str | None]:
+    """
+    Decode a StrOrErr into (str, err). Each c_char_p field access copies the C string,
+    so err is read once and str is only read on the success path.
+    """
+    err = result.err
+    if err:
+        return None, err.decode("utf-8")
+    value = result.str
+    return (value.decode("utf-8") if value else None), None
+
+
+# argtypes/restype for every exported signer function, applied once when the
+# library is loaded instead of on every request
+SIGNER_SIGNATURES = {
+    "SwitchAPIKey": ([ctypes.c_int], ctypes.c_char_p),
+    "CreateClient": (
+        [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_longlong],
+        ctypes.c_char_p,
+    ),
+    "CheckClient": ([ctypes.c_int, ctypes.c_longlong], ctypes.c_char_p),
+    "GenerateAPIKey": ([ctypes.c_char_p], ApiKeyResponse),
+    "SignChangePubKey": ([ctypes.c_char_p, ctypes.c_longlong], StrOrErr),
+    "SignCreateOrder": (
+        [
+            ctypes.c_int,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+        ],
+        StrOrErr,
+    ),
+    "SignCancelOrder": ([ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignWithdraw": ([ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignCreateSubAccount": ([ctypes.c_longlong], StrOrErr),
+    "SignCancelAllOrders": ([ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignModifyOrder": (
+        [
+            ctypes.c_int,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+            ctypes.c_longlong,
+        ],
+        StrOrErr,
+    ),
+    "SignTransfer": (
+        [ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_char_p, ctypes.c_longlong],
+        StrOrErr,
+    ),
+    "SignCreatePublicPool": (
+        [ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong],
+        StrOrErr,
+    ),
+    "SignUpdatePublicPool": (
+        [ctypes.c_longlong, ctypes.c_int, ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong],
+        StrOrErr,
+    ),
+    "SignMintShares": ([ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignBurnShares": ([ctypes.c_longlong, ctypes.c_longlong, ctypes.c_longlong], StrOrErr),
+    "SignUpdateLeverage": ([ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_longlong], StrOrErr),
+    "CreateAuthToken": ([ctypes.c_longlong], StrOrErr),
+}
+
+
+def _configure_signatures(lib):
+    for name, (argtypes, restype) in SIGNER_SIGNATURES.items():
+        func = getattr(lib, name)
+        func.argtypes = argtypes
+        func.restype = restype
+
+
 def _initialize_signer():
     is_linux = platform.system() == "Linux"
     is_mac = platform.system() == "Darwin"
@@ -94,76 +203,107 @@ def _initialize_signer():
     path_to_signer_folders = os.path.join(current_file_directory, "signers")
 
     if is_arm and is_mac:
-        logging.debug("Detected ARM architecture on macOS.")
-        return ctypes.CDLL(os.path.join(path_to_signer_folders, "signer-arm64.dylib"))
+        logger.debug("Detected ARM architecture on macOS.")
+        lib_name = "signer-arm64.dylib"
     elif is_linux and is_x64:
-        logging.debug("Detected x64/amd architecture on Linux.")
-        return ctypes.CDLL(os.path.join(path_to_signer_folders, "signer-amd64.so"))
+        logger.debug("Detected x64/amd architecture on Linux.")
+        lib_name = "signer-amd64.so"
     elif is_windows and is_x64:
-        logging.debug("Detected x64/amd architecture on Windows.")
-        return ctypes.CDLL(os.path.join(path_to_signer_folders, "signer-amd64.dll"))
+        logger.debug("Detected x64/amd architecture on Windows.")
+        lib_name = "signer-amd64.dll"
     else:
         raise Exception(
             f"Unsupported platform/architecture: {platform.system()}/{platform.machine()}. "
             "Currently supported: Linux(x86_64), macOS(arm64), and Windows(x86_64)."
         )
 
+    # Bind every symbol at load time so the first request doesn't pay for lazy
+    # resolution; _configure_signatures then looks up each function we call.
+    # dlopen modes don't exist on Windows, where LoadLibrary binds eagerly anyway.
+    mode = getattr(os, "RTLD_NOW", 0) | ctypes.RTLD_LOCAL
+    lib = ctypes.CDLL(os.path.join(path_to_signer_folders, lib_name), mode=mode)
+    _configure_signatures(lib)
+    return lib
+
 
 try:
     signer = _initialize_signer()
 except Exception as e:
-    logging.error(f"Failed to initialize signer: {e}")
+    logger.error("Failed to initialize signer: %s", e)
     signer = None
 
+# Signer loaded by create_api_key when the main one failed to initialize
+_fallback_signer: ctypes.CDLL | None = None
+
 # Store client configurations and private keys
 # CRITICAL: We must store full config to recreate clients on demand
 # because Go SDK's backupTxClients[api_key_index] can only hold ONE client per api_key_index
-clients = {}  # client_key -> {url, chain_id, api_key_index, account_index, private_key}
-api_key_dict = {}  # Store api_key_index -> private_key mapping (legacy, may have conflicts)
+clients = {}  # (api_key_index, account_index) -> {url, chain_id, api_key_index, account_index, private_key} (url and key as bytes)
 
-# Global lock to ensure thread safety for Go SDK
+# Single signer thread that owns the Go SDK
 # CRITICAL: The underlying Go library (lighter-go sharedlib.go) is NOT thread-safe:
 #   - var txClient *Client (current active client - GLOBAL STATE)
 #   - var backupTxClients map[uint8]*Client (client storage - GLOBAL STATE)
 #   - SwitchAPIKey() modifies txClient WITHOUT synchronization
 #   - CheckClient() may switch internal state
 #
-# Lock ordering is CRITICAL:
-#   1. global_signer_lock (OUTERMOST) - Protects Go SDK global state
-#   2. account_lock (INNER) - Serializes nonce operations for same account
+# Every call into the Go library runs as a job on this single-worker executor, which
+# drains its queue FIFO. A sign request submits activate + sign as ONE job
+# (sign_with_client), so no other client can be activated in between, and the
+# blocking ctypes calls never stall the event loop.
 #
-# WHY this order matters:
-#   - If account_lock were outer, different accounts could hold different account_locks,
-#     then compete for global_signer_lock, causing Go SDK state to be polluted between
-#     different accounts' signing operations
-#   - With global_signer_lock outer, only ONE account can interact with Go SDK at a time,
-#     preventing all race conditions
+# Nonces are chosen by the client, so no per-account lock is needed either: requests
+# hold no lock at all, and Python work such as L1 signing runs concurrently.
+signer_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="signer")
+
+
+async def run_in_signer_thread(func, *args):
+    """Run a blocking signer call on the signer thread and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(signer_executor, func, *args)
+
+
+# (api_key_index, account_index) of the client the Go SDK currently has active, or None
+# when unknown. Only read and written on the signer thread.
 #
-# Trade-off: Sacrifices concurrency for correctness - all Go SDK operations are serialized.
-global_signer_lock = asyncio.Lock()
+# Invariant relied on by _activate_client_internal: the Go SDK's active txClient only
+# changes in these exported entry points:
+#   - CreateClient: makes the new client active (tracked by _create_client_sync)
+#   - SwitchAPIKey: sets txClient = backupTxClients[api_key_index] (never called here)
+#   - CheckClient: did not switch txClient when checked, but is treated as unknown
+#     (_check_client_sync resets the tracker)
+# GenerateAPIKey, CreateAuthToken and every Sign* function only read txClient, so
+# /create_api_key and signing leave the tracker valid. Recheck this list whenever the
+# signer binaries are updated; any new entry point that switches clients must reset it.
+_active_client: tuple | None = None
+
 
+class RequestModel(BaseModel):
+    """Base for request bodies - they are never mutated after validation."""
+    model_config = ConfigDict(frozen=True)
 
-class CreateClientRequest(BaseModel):
+
+class CreateClientRequest(RequestModel):
     url: str
     private_key: str
-    chain_id: Optional[int] = None
+    chain_id: int | None = None
     api_key_index: int
     account_index: int
 
 
-class CreateApiKeyRequest(BaseModel):
-    seed: str = ""
+class CreateApiKeyRequest(RequestModel):
+    seed: bytes = b""
 
 
-class SignChangeApiKeyRequest(BaseModel):
+class SignChangeApiKeyRequest(RequestModel):
     api_key_index: int
     account_index: int
     eth_private_key: str
-    new_pubkey: str
+    new_pubkey: bytes
     nonce: int = -1
 
 
-class SignCreateOrderRequest(BaseModel):
+class SignCreateOrderRequest(RequestModel):
     api_key_index: int
     account_index: int
     market_index: int
@@ -179,7 +319,16 @@ class SignCreateOrderRequest(BaseModel):
     nonce: int = -1
 
 
-class SignCancelOrderRequest(BaseModel):
+# Each account group of a batch is one job on the single signer thread, so the batch
+# size bounds how long one request can hold up every other client's signing
+MAX_BATCH_ORDERS = 50
+
+
+class SignCreateOrderBatchRequest(RequestModel):
+    orders: list[SignCreateOrderRequest] = Field(max_length=MAX_BATCH_ORDERS)
+
+
+class SignCancelOrderRequest(RequestModel):
     api_key_index: int
     account_index: int
     market_index: int
@@ -187,20 +336,20 @@ class SignCancelOrderRequest(BaseModel):
     nonce: int = -1
 
 
-class SignWithdrawRequest(BaseModel):
+class SignWithdrawRequest(RequestModel):
     api_key_index: int
     account_index: int
     usdc_amount: int
     nonce: int = -1
 
 
-class SignCreateSubAccountRequest(BaseModel):
+class SignCreateSubAccountRequest(RequestModel):
     api_key_index: int
     account_index: int
     nonce: int = -1
 
 
-class SignCancelAllOrdersRequest(BaseModel):
+class SignCancelAllOrdersRequest(RequestModel):
     api_key_index: int
     account_index: int
     time_in_force: int
@@ -208,7 +357,7 @@ class SignCancelAllOrdersRequest(BaseModel):
     nonce: int = -1
 
 
-class SignModifyOrderRequest(BaseModel):
+class SignModifyOrderRequest(RequestModel):
     api_key_index: int
     account_index: int
     market_index: int
@@ -219,18 +368,18 @@ class SignModifyOrderRequest(BaseModel):
     nonce: int = -1
 
 
-class SignTransferRequest(BaseModel):
+class SignTransferRequest(RequestModel):
     api_key_index: int
     account_index: int
     eth_private_key: str
     to_account_index: int
     usdc_amount: int
     fee: int
-    memo: str
+    memo: bytes
     nonce: int = -1
 
 
-class SignCreatePublicPoolRequest(BaseModel):
+class SignCreatePublicPoolRequest(RequestModel):
     api_key_index: int
     account_index: int
     operator_fee: int
@@ -239,7 +388,7 @@ class SignCreatePublicPoolRequest(BaseModel):
     nonce: int = -1
 
 
-class SignUpdatePublicPoolRequest(BaseModel):
+class SignUpdatePublicPoolRequest(RequestModel):
     api_key_index: int
     account_index: int
     public_pool_index: int
@@ -249,7 +398,7 @@ class SignUpdatePublicPoolRequest(BaseModel):
     nonce: int = -1
 
 
-class SignMintSharesRequest(BaseModel):
+class SignMintSharesRequest(RequestModel):
     api_key_index: int
     account_index: int
     public_pool_index: int
@@ -257,7 +406,7 @@ class SignMintSharesRequest(BaseModel):
     nonce: int = -1
 
 
-class SignBurnSharesRequest(BaseModel):
+class SignBurnSharesRequest(RequestModel):
     api_key_index: int
     account_index: int
     public_pool_index: int
@@ -265,7 +414,7 @@ class SignBurnSharesRequest(BaseModel):
     nonce: int = -1
 
 
-class SignUpdateLeverageRequest(BaseModel):
+class SignUpdateLeverageRequest(RequestModel):
     api_key_index: int
     account_index: int
     market_index: int
@@ -274,79 +423,126 @@ class SignUpdateLeverageRequest(BaseModel):
     nonce: int = -1
 
 
-class CreateAuthTokenRequest(BaseModel):
+class CreateAuthTokenRequest(RequestModel):
     api_key_index: int
     account_index: int
     deadline: int
 
 
-class SwitchApiKeyRequest(BaseModel):
+class SwitchApiKeyRequest(RequestModel):
     api_key_index: int
 
 
-class CheckClientRequest(BaseModel):
+class CheckClientRequest(RequestModel):
     api_key_index: int
     account_index: int
 
 
-def get_client_key(api_key_index: int, account_index: int) -> str:
-    return f"{api_key_index}:{account_index}"
+def make_sign_args(*field_names):
+    """
+    Build a function returning a request's C arguments, as a tuple, in signature order.
+    attrgetter reads all the fields in one C-level call instead of one attribute lookup
+    each; with a single field it returns the bare value, so that case is wrapped.
+    """
+    getter = operator.attrgetter(*field_names)
+    if len(field_names) == 1:
+        return lambda request: (getter(request),)
+    return getter
+
+
+SIGN_CREATE_ORDER_ARGS = make_sign_args(
+    "market_index",
+    "client_order_index",
+    "base_amount",
+    "price",
+    "is_ask",
+    "order_type",
+    "time_in_force",
+    "reduce_only",
+    "trigger_price",
+    "order_expiry",
+)
+SIGN_CANCEL_ORDER_ARGS = make_sign_args("market_index", "order_index")
+SIGN_CANCEL_ALL_ORDERS_ARGS = make_sign_args("time_in_force", "time")
+SIGN_MODIFY_ORDER_ARGS = make_sign_args(
+    "market_index",
+    "order_index",
+    "base_amount",
+    "price",
+    "trigger_price",
+)
+SIGN_TRANSFER_ARGS = make_sign_args(
+    "to_account_index",
+    "usdc_amount",
+    "fee",
+    "memo",
+)
+SIGN_CREATE_PUBLIC_POOL_ARGS = make_sign_args("operator_fee", "initial_total_shares", "min_operator_share_rate")
+SIGN_UPDATE_PUBLIC_POOL_ARGS = make_sign_args(
+    "public_pool_index",
+    "status",
+    "operator_fee",
+    "min_operator_share_rate",
+)
+SIGN_MINT_SHARES_ARGS = make_sign_args("public_pool_index", "share_amount")
+SIGN_BURN_SHARES_ARGS = make_sign_args("public_pool_index", "share_amount")
+SIGN_UPDATE_LEVERAGE_ARGS = make_sign_args("market_index", "fraction", "margin_mode")
+
 
+def _create_client_sync(url: bytes, private_key: bytes, chain_id: int, api_key_index: int, account_index: int):
+    """Call CreateClient and record the resulting active client - must run on the signer thread"""
+    global _active_client
+    err = signer.CreateClient(url, private_key, chain_id, api_key_index, account_index)
+    # CreateClient makes the new client active; on failure the Go state is unknown
+    _active_client = None if err else (api_key_index, account_index)
+    return err
 
-async def _switch_api_key_internal(api_key_index: int):
-    """Internal function to switch API key - must be called within a lock"""
-    if not signer:
-        raise HTTPException(status_code=500, detail="Signer not initialized")
 
-    signer.SwitchAPIKey.argtypes = [ctypes.c_int]
-    signer.SwitchAPIKey.restype = ctypes.c_char_p
+def _get_client_config(api_key_index: int, account_index: int) -> dict:
+    """
+    Registered config for a client. Raises 400 if /create_client was never called for it.
 
-    result = signer.SwitchAPIKey(api_key_index)
-    if result:
-        error_msg = result.decode("utf-8")
-        raise HTTPException(status_code=400, detail=f"Failed to switch API key: {error_msg}")
+    clients is only read and written on the event loop; signer-thread jobs are handed the
+    config they need, so the registry needs no lock of its own.
+    """
+    client_config = clients.get((api_key_index, account_index))
+    if client_config is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Client not found for api_key={api_key_index}, account={account_index}. Call /create_client first."
+        )
+    return client_config
 
 
-async def _activate_client_internal(api_key_index: int, account_index: int):
+def _activate_client_internal(client_config: dict):
     """
-    Internal function to activate a specific (api_key_index, account_index) client.
-    Must be called within global_signer_lock BEFORE signing operations.
+    Internal function to activate the (api_key_index, account_index) client in client_config.
+    Must run on the signer thread BEFORE signing operations.
 
     CRITICAL FIX for Go SDK limitation:
     - Go SDK's backupTxClients[api_key_index] can only store ONE TxClient per api_key_index
     - When multiple accounts use the same api_key_index, we must RECREATE the correct client
-      each time before signing
-    - This is safe because we hold global_signer_lock (all operations are serialized)
+      whenever a different client was used since
+    - This is safe because it runs on the signer thread (all operations are serialized)
     """
     if not signer:
         raise HTTPException(status_code=500, detail="Signer not initialized")
 
-    # Get client config from Python storage
-    client_key = get_client_key(api_key_index, account_index)
-    if client_key not in clients:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Client not found for api_key={api_key_index}, account={account_index}. Call /create_client first."
-        )
+    api_key_index = client_config["api_key_index"]
+    account_index = client_config["account_index"]
 
-    client_config = clients[client_key]
+    # Consecutive requests for the same client skip the CreateClient round trip; see the
+    # invariant above _active_client for which Go calls can switch the active client
+    if _active_client == (api_key_index, account_index):
+        return
 
-    logging.debug(f"Recreating client for api_key={api_key_index}, account={account_index}")
+    logger.debug("Recreating client for api_key=%s, account=%s", api_key_index, account_index)
 
     # CRITICAL: Recreate the client to ensure correct (api_key, account) combination
     # This overwrites backupTxClients[api_key_index] with the correct account's client
-    signer.CreateClient.argtypes = [
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_longlong,
-    ]
-    signer.CreateClient.restype = ctypes.c_char_p
-
-    err = signer.CreateClient(
-        client_config["url"].encode("utf-8"),
-        client_config["private_key"].encode("utf-8"),
+    err = _create_client_sync(
+        client_config["url"],
+        client_config["private_key"],
         client_config["chain_id"],
         api_key_index,
         account_index,
@@ -354,10 +550,106 @@ async def _activate_client_internal(api_key_index: int, account_index: int):
 
     if err:
         error_msg = err.decode("utf-8")
-        logging.error(f"Failed to recreate client for api_key={api_key_index}, account={account_index}: {error_msg}")
+        logger.error("Failed to recreate client for api_key=%s, account=%s: %s", api_key_index, account_index, error_msg)
         raise HTTPException(status_code=500, detail=f"Failed to activate client: {error_msg}")
 
-    logging.debug(f"✅ Client activated for api_key={api_key_index}, account={account_index}")
+    logger.debug("✅ Client activated for api_key=%s, account=%s", api_key_index, account_index)
+
+
+def _activate_and_call(client_config: dict, func, *args):
+    """
+    Activate the client and call func as a single job on the signer thread, so no
+    other client can be activated between the two.
+    """
+    _activate_client_internal(client_config)
+    return func(*args)
+
+
+async def sign_with_client(api_key_index: int, account_index: int, func, *args):
+    """Look up the client, then activate it and call func on the signer thread"""
+    client_config = _get_client_config(api_key_index, account_index)
+    return await run_in_signer_thread(_activate_and_call, client_config, func, *args)
+
+
+def _check_client_sync(api_key_index: int, account_index: int):
+    """Call CheckClient, which may switch the active client - must run on the signer thread"""
+    global _active_client
+    _active_client = None
+    return signer.CheckClient(api_key_index, account_index)
+
+
+# Parsed L1 signing keys, keyed by a hash of the private key so the raw key is never a
+# dict key. L1 keys rarely change between requests.
+# L1 signing runs on worker threads, so the cache has its own lock.
+L1_KEY_CACHE_SIZE = 256
+_l1_key_cache = OrderedDict()
+_l1_key_cache_lock = threading.Lock()
+
+EIP191_PREFIX = b"\x19Ethereum Signed Message:\n"
+
+
+def _get_l1_key(eth_private_key: str) -> coincurve.PrivateKey:
+    """Return the secp256k1 key for an L1 private key (hex, optionally 0x-prefixed)"""
+    cache_key = hashlib.blake2b(eth_private_key.encode("utf-8"), digest_size=16).digest()
+    with _l1_key_cache_lock:
+        key = _l1_key_cache.get(cache_key)
+        if key is not None:
+            _l1_key_cache.move_to_end(cache_key)
+            return key
+
+    key_hex = eth_private_key[2:] if eth_private_key[:2].lower() == "0x" else eth_private_key
+    key = coincurve.PrivateKey(bytes.fromhex(key_hex))
+    with _l1_key_cache_lock:
+        _l1_key_cache[cache_key] = key
+        if len(_l1_key_cache) > L1_KEY_CACHE_SIZE:
+            _l1_key_cache.popitem(last=False)
+    return key
+
+
+def _add_l1_signature(tx_info_str: str, eth_private_key: str) -> str:
+    """Replace MessageToSign in the signed tx_info with its L1 signature; returns the new tx_info"""
+    tx_info = orjson.loads(tx_info_str)
+    message = tx_info.pop("MessageToSign").encode("utf-8")
+
+    # EIP-191 personal_sign, signed directly with libsecp256k1: r || s || v with v = 27/28
+    digest = keccak(EIP191_PREFIX + str(len(message)).encode("ascii") + message)
+    signature = _get_l1_key(eth_private_key).sign_recoverable(digest, hasher=None)
+    tx_info["L1Sig"] = "0x" + signature[:64].hex() + f"{signature[64] + 27:02x}"
+    return orjson.dumps(tx_info).decode("utf-8")
+
+
+async def _run_sign(request, func_name: str, *args) -> str | None:
+    """
+    Shared pipeline for the sign endpoints: validate the nonce, then activate the client
+    and call signer.<func_name>(*args, nonce) on the signer thread. Returns the signed
+    tx_info string; a Go SDK error is raised as a 400.
+    """
+    if not signer:
+        raise HTTPException(status_code=500, detail="Signer not initialized")
+
+    # Validate the client-provided nonce
+    managed_nonce = await nonce_manager.get_next_nonce(
+        account_index=request.account_index,
+        api_key_index=request.api_key_index,
+        provided_nonce=request.nonce
+    )
+
+    result = await sign_with_client(
+        request.api_key_index, request.account_index,
+        getattr(signer, func_name), *args, managed_nonce)
+
+    tx_info, error = read_str_or_err(result)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    return tx_info
+
+
+def tx_info_response(tx_info: str | None) -> Response:
+    """
+    {"tx_info": ...} response built straight from the signer's string. Returning a
+    Response skips FastAPI's jsonable_encoder pass over the result dict.
+    """
+    return Response(content=b'{"tx_info":' + orjson.dumps(tx_info) + b"}", media_type="application/json")
 
 
 @app.get("/health")
@@ -369,7 +661,7 @@ async def health_check():
         "service": "Lighter Signing Service",
         "version": VERSION,
         "thread_safe": True,
-        "lock_type": "global_outermost",
+        "lock_type": "signer_thread",
         "signer": signer_status,
         "platform": f"{platform.system()}/{platform.machine()}",
         "note": "All Go SDK operations are serialized for safety"
@@ -380,7 +672,7 @@ async def health_check():
 async def create_client(request: CreateClientRequest):
     """
     Create a new client. This operation is thread-safe.
-    Uses global lock to prevent race conditions in the underlying Go library.
+    Runs on the signer thread to prevent race conditions in the underlying Go library.
     """
     try:
         if not signer:
@@ -394,46 +686,39 @@ async def create_client(request: CreateClientRequest):
         if private_key.startswith("0x"):
             private_key = private_key[2:]
 
-        # Acquire global lock to ensure thread-safe client creation
-        async with global_signer_lock:
-            # Store the private key for this api_key_index
-            api_key_dict[request.api_key_index] = private_key
-
-            signer.CreateClient.argtypes = [
-                ctypes.c_char_p,
-                ctypes.c_char_p,
-                ctypes.c_int,
-                ctypes.c_int,
-                ctypes.c_longlong,
-            ]
-            signer.CreateClient.restype = ctypes.c_char_p
-
-            err = signer.CreateClient(
-                request.url.encode("utf-8"),
-                private_key.encode("utf-8"),
-                chain_id,
-                request.api_key_index,
-                request.account_index,
-            )
+        # Encode once; the encoded values are also kept for reactivation
+        url_bytes = request.url.encode("utf-8")
+        private_key_bytes = private_key.encode("utf-8")
+
+        err = await run_in_signer_thread(
+            _create_client_sync,
+            url_bytes,
+            private_key_bytes,
+            chain_id,
+            request.api_key_index,
+            request.account_index,
+        )
 
-            if err:
-                err_str = err.decode("utf-8")
-                raise HTTPException(status_code=400, detail=err_str)
+        if err:
+            err_str = err.decode("utf-8")
+            raise HTTPException(status_code=400, detail=err_str)
 
-            client_key = get_client_key(request.api_key_index, request.account_index)
-            clients[client_key] = {
-                "url": request.url,
-                "chain_id": chain_id,
-                "api_key_index": request.api_key_index,
-                "account_index": request.account_index,
-                "private_key": private_key  # Store for recreating client on demand
-            }
+        clients[(request.api_key_index, request.account_index)] = {
+            "url": url_bytes,
+            "chain_id": chain_id,
+            "api_key_index": request.api_key_index,
+            "account_index": request.account_index,
+            "private_key": private_key_bytes  # Store for recreating client on demand
+        }
 
-        return {"message": "Client created successfully", "client_key": client_key}
+        return {
+            "message": "Client created successfully",
+            "client_key": f"{request.api_key_index}:{request.account_index}"
+        }
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in create_client: {e}")
+        logger.exception("Error in create_client")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -443,18 +728,10 @@ async def check_client(request: CheckClientRequest):
     Check if a client exists and is valid. Thread-safe read operation.
     """
     try:
-        # Acquire global lock
-        async with global_signer_lock:
-            signer.CheckClient.argtypes = [
-                ctypes.c_int,
-                ctypes.c_longlong,
-            ]
-            signer.CheckClient.restype = ctypes.c_char_p
-
-            result = signer.CheckClient(request.api_key_index, request.account_index)
-            if result:
-                return {"error": result.decode("utf-8")}
-            return {"message": "Client is valid"}
+        result = await run_in_signer_thread(_check_client_sync, request.api_key_index, request.account_index)
+        if result:
+            return {"error": result.decode("utf-8")}
+        return {"message": "Client is valid"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -462,16 +739,16 @@ async def check_client(request: CheckClientRequest):
 @app.post("/switch_api_key")
 async def switch_api_key(request: SwitchApiKeyRequest):
     """
-    Switch the active API key. Thread-safe with global locking.
+    Switch the active API key. Thread-safe via the signer thread.
     """
     try:
-        async with global_signer_lock:
-            await _activate_client_internal(request.api_key_index, request.account_index)
-            return {"message": "API key switched successfully"}
+        client_config = _get_client_config(request.api_key_index, request.account_index)
+        await run_in_signer_thread(_activate_client_internal, client_config)
+        return {"message": "API key switched successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in switch_api_key: {e}")
+        logger.exception("Error in switch_api_key")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -482,16 +759,16 @@ async def create_api_key(request: CreateApiKeyRequest):
     Thread-safe as it doesn't modify global state.
     """
     try:
+        global _fallback_signer
         if not signer:
-            # Create a temporary signer for this operation
-            temp_signer = _initialize_signer()
+            # Load a fallback signer for this operation, reused by later calls
+            if _fallback_signer is None:
+                _fallback_signer = _initialize_signer()
+            temp_signer = _fallback_signer
         else:
             temp_signer = signer
 
-        temp_signer.GenerateAPIKey.argtypes = [ctypes.c_char_p]
-        temp_signer.GenerateAPIKey.restype = ApiKeyResponse
-
-        result = temp_signer.GenerateAPIKey(ctypes.c_char_p(request.seed.encode("utf-8")))
+        result = await run_in_signer_thread(temp_signer.GenerateAPIKey, request.seed)
 
         private_key_str = result.privateKey.decode("utf-8") if result.privateKey else None
         public_key_str = result.publicKey.decode("utf-8") if result.publicKey else None
@@ -507,73 +784,26 @@ async def create_api_key(request: CreateApiKeyRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in create_api_key: {e}")
+        logger.exception("Error in create_api_key")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_change_api_key")
 async def sign_change_api_key(request: SignChangeApiKeyRequest):
     """
-    Sign a change API key transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a change API key transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
+        tx_info_str = await _run_sign(request, "SignChangePubKey", request.new_pubkey)
 
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignChangePubKey.argtypes = [
-                    ctypes.c_char_p,
-                    ctypes.c_longlong,
-                ]
-                signer.SignChangePubKey.restype = StrOrErr
-                result = signer.SignChangePubKey(ctypes.c_char_p(request.new_pubkey.encode("utf-8")), managed_nonce)
-
-                tx_info_str = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-
-                    raise HTTPException(status_code=400, detail=error)
-
-                tx_info = json.loads(tx_info_str)
-                msg_to_sign = tx_info["MessageToSign"]
-                del tx_info["MessageToSign"]
-
-                acct = Account.from_key(request.eth_private_key)
-                message = encode_defunct(text=msg_to_sign)
-                signature = acct.sign_message(message)
-                tx_info["L1Sig"] = signature.signature.to_0x_hex()
-
-            # Success - return result
-            return {"tx_info": json.dumps(tx_info)}
+        # L1 signing runs on a worker thread so the ECDSA work doesn't block the event loop
+        tx_info = await asyncio.to_thread(_add_l1_signature, tx_info_str, request.eth_private_key)
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_change_api_key: {e}")
+        logger.exception("Error in sign_change_api_key")
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -582,811 +812,403 @@ async def sign_create_order(request: SignCreateOrderRequest):
     """
     Sign a create order transaction with strict serialization for Go SDK safety.
 
-    Lock ordering (CRITICAL for correctness):
-    1. global_signer_lock (outermost) - Protects non-thread-safe Go SDK
-    2. account_lock (inner) - Serializes nonce operations for same account
+    Serialization (CRITICAL for correctness):
+    the signer thread runs activate + sign as one job on the non-thread-safe Go SDK.
 
     All Go SDK operations are fully serialized to prevent state corruption.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
+        logger.debug(
+            "sign_create_order request: api_key_index=%s, market_index=%s, client_order_index=%s, "
+            "base_amount=%s, price=%s, is_ask=%s, order_type=%s, time_in_force=%s, reduce_only=%s, "
+            "trigger_price=%s, order_expiry=%s, nonce=%s",
+            request.api_key_index, request.market_index, request.client_order_index,
+            request.base_amount, request.price, request.is_ask, request.order_type, request.time_in_force,
+            request.reduce_only, request.trigger_price, request.order_expiry, request.nonce
+        )
 
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                logging.debug(f"sign_create_order request: api_key_index={request.api_key_index}, "
-                             f"market_index={request.market_index}, "
-                             f"client_order_index={request.client_order_index}, base_amount={request.base_amount}, "
-                             f"price={request.price}, is_ask={request.is_ask}, "
-                             f"order_type={request.order_type}, time_in_force={request.time_in_force}, "
-                             f"reduce_only={request.reduce_only}, "
-                             f"trigger_price={request.trigger_price}, order_expiry={request.order_expiry}, "
-                             f"nonce={request.nonce} → managed_nonce={managed_nonce}")
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignCreateOrder.argtypes = [
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignCreateOrder.restype = StrOrErr
-
-                result = signer.SignCreateOrder(
-                    request.market_index,
-                    request.client_order_index,
-                    request.base_amount,
-                    request.price,
-                    int(request.is_ask),
-                    request.order_type,
-                    request.time_in_force,
-                    request.reduce_only,
-                    request.trigger_price,
-                    request.order_expiry,
-                    managed_nonce,  # Use managed nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-            # Success - nonce manager already incremented
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignCreateOrder", *SIGN_CREATE_ORDER_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_create_order: {e}")
+        logger.exception("Error in sign_create_order")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/sign_cancel_order")
-async def sign_cancel_order(request: SignCancelOrderRequest):
+def _sign_create_order_batch_sync(client_config: dict, orders, nonces) -> list:
+    """Activate the client once and sign every order - must run on the signer thread"""
+    _activate_client_internal(client_config)
+
+    results = []
+    for order, nonce in zip(orders, nonces):
+        result = signer.SignCreateOrder(*SIGN_CREATE_ORDER_ARGS(order), nonce)
+        tx_info, error = read_str_or_err(result)
+        if error:
+            results.append({"error": error})
+        else:
+            results.append({"tx_info": tx_info})
+    return results
+
+
+@app.post("/sign_create_order_batch")
+async def sign_create_order_batch(request: SignCreateOrderBatchRequest):
     """
-    Sign a cancel order transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign several create order transactions in one request.
+
+    Orders are grouped by (api_key_index, account_index). Each group's nonces are
+    validated together and it is signed as a single signer-thread job, so the client is
+    activated once per group instead of once per order. Results are returned in input order;
+    an order the Go SDK rejects gets {"error": ...} instead of {"tx_info": ...}.
     """
     try:
         if not signer:
             raise HTTPException(status_code=500, detail="Signer not initialized")
 
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignCancelOrder.argtypes = [
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignCancelOrder.restype = StrOrErr
+        groups = {}  # (api_key_index, account_index) -> [position in request.orders]
+        for position, order in enumerate(request.orders):
+            groups.setdefault((order.api_key_index, order.account_index), []).append(position)
 
-                result = signer.SignCancelOrder(request.market_index, request.order_index, managed_nonce)
+        results = [None] * len(request.orders)
+        for (api_key_index, account_index), positions in groups.items():
+            orders = [request.orders[position] for position in positions]
 
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
+            nonces = await nonce_manager.get_next_nonces(
+                account_index=account_index,
+                api_key_index=api_key_index,
+                provided_nonces=[order.nonce for order in orders]
+            )
+
+            client_config = _get_client_config(api_key_index, account_index)
+            group_results = await run_in_signer_thread(
+                _sign_create_order_batch_sync, client_config, orders, nonces)
 
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
+            for position, result in zip(positions, group_results):
+                results[position] = result
 
-                # Success - return result
-            return {"tx_info": tx_info}
+        return ORJSONResponse(results)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_cancel_order: {e}")
+        logger.exception("Error in sign_create_order_batch")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/sign_withdraw")
-async def sign_withdraw(request: SignWithdrawRequest):
+@app.post("/sign_cancel_order")
+async def sign_cancel_order(request: SignCancelOrderRequest):
     """
-    Sign a withdraw transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a cancel order transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignWithdraw.argtypes = [ctypes.c_longlong, ctypes.c_longlong]
-                signer.SignWithdraw.restype = StrOrErr
-
-                result = signer.SignWithdraw(request.usdc_amount, managed_nonce)
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
+        tx_info = await _run_sign(request, "SignCancelOrder", *SIGN_CANCEL_ORDER_ARGS(request))
+        return tx_info_response(tx_info)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Error in sign_cancel_order")
+        raise HTTPException(status_code=500, detail=str(e))
 
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
 
-                # Success - return result
-            return {"tx_info": tx_info}
+@app.post("/sign_withdraw")
+async def sign_withdraw(request: SignWithdrawRequest):
+    """
+    Sign a withdraw transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
+    """
+    try:
+        tx_info = await _run_sign(request, "SignWithdraw", request.usdc_amount)
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_withdraw: {e}")
+        logger.exception("Error in sign_withdraw")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_create_sub_account")
 async def sign_create_sub_account(request: SignCreateSubAccountRequest):
     """
-    Sign a create sub-account transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a create sub-account transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignCreateSubAccount.argtypes = [ctypes.c_longlong]
-                signer.SignCreateSubAccount.restype = StrOrErr
-
-                result = signer.SignCreateSubAccount(managed_nonce)
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignCreateSubAccount")
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_create_sub_account: {e}")
+        logger.exception("Error in sign_create_sub_account")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_cancel_all_orders")
 async def sign_cancel_all_orders(request: SignCancelAllOrdersRequest):
     """
-    Sign a cancel all orders transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a cancel all orders transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignCancelAllOrders.argtypes = [
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignCancelAllOrders.restype = StrOrErr
-
-                result = signer.SignCancelAllOrders(request.time_in_force, request.time, managed_nonce)
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignCancelAllOrders", *SIGN_CANCEL_ALL_ORDERS_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_cancel_all_orders: {e}")
+        logger.exception("Error in sign_cancel_all_orders")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_modify_order")
 async def sign_modify_order(request: SignModifyOrderRequest):
     """
-    Sign a modify order transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a modify order transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignModifyOrder.argtypes = [
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignModifyOrder.restype = StrOrErr
-
-                result = signer.SignModifyOrder(
-                    request.market_index,
-                    request.order_index,
-                    request.base_amount,
-                    request.price,
-                    request.trigger_price,
-                    managed_nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignModifyOrder", *SIGN_MODIFY_ORDER_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_modify_order: {e}")
+        logger.exception("Error in sign_modify_order")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_transfer")
 async def sign_transfer(request: SignTransferRequest):
     """
-    Sign a transfer transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a transfer transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignTransfer.argtypes = [
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_char_p,
-                    ctypes.c_longlong,
-                ]
-                signer.SignTransfer.restype = StrOrErr
-
-                result = signer.SignTransfer(
-                    request.to_account_index,
-                    request.usdc_amount,
-                    request.fee,
-                    ctypes.c_char_p(request.memo.encode("utf-8")),
-                    managed_nonce
-                )
-
-                tx_info_str = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
+        tx_info_str = await _run_sign(request, "SignTransfer", *SIGN_TRANSFER_ARGS(request))
 
-                if error:
-
-                    raise HTTPException(status_code=400, detail=error)
-
-                tx_info = json.loads(tx_info_str)
-                msg_to_sign = tx_info["MessageToSign"]
-                del tx_info["MessageToSign"]
-
-                acct = Account.from_key(request.eth_private_key)
-                message = encode_defunct(text=msg_to_sign)
-                signature = acct.sign_message(message)
-                tx_info["L1Sig"] = signature.signature.to_0x_hex()
-
-            # Success - return result
-            return {"tx_info": json.dumps(tx_info)}
+        # L1 signing runs on a worker thread so the ECDSA work doesn't block the event loop
+        tx_info = await asyncio.to_thread(_add_l1_signature, tx_info_str, request.eth_private_key)
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_transfer: {e}")
+        logger.exception("Error in sign_transfer")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_create_public_pool")
 async def sign_create_public_pool(request: SignCreatePublicPoolRequest):
     """
-    Sign a create public pool transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a create public pool transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignCreatePublicPool.argtypes = [
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignCreatePublicPool.restype = StrOrErr
-
-                result = signer.SignCreatePublicPool(
-                    request.operator_fee,
-                    request.initial_total_shares,
-                    request.min_operator_share_rate,
-                    managed_nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignCreatePublicPool", *SIGN_CREATE_PUBLIC_POOL_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_create_public_pool: {e}")
+        logger.exception("Error in sign_create_public_pool")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_update_public_pool")
 async def sign_update_public_pool(request: SignUpdatePublicPoolRequest):
     """
-    Sign an update public pool transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign an update public pool transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignUpdatePublicPool.argtypes = [
-                    ctypes.c_longlong,
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignUpdatePublicPool.restype = StrOrErr
-
-                result = signer.SignUpdatePublicPool(
-                    request.public_pool_index,
-                    request.status,
-                    request.operator_fee,
-                    request.min_operator_share_rate,
-                    managed_nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignUpdatePublicPool", *SIGN_UPDATE_PUBLIC_POOL_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_update_public_pool: {e}")
+        logger.exception("Error in sign_update_public_pool")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_mint_shares")
 async def sign_mint_shares(request: SignMintSharesRequest):
     """
-    Sign a mint shares transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a mint shares transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignMintShares.argtypes = [
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignMintShares.restype = StrOrErr
-
-                result = signer.SignMintShares(
-                    request.public_pool_index,
-                    request.share_amount,
-                    managed_nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignMintShares", *SIGN_MINT_SHARES_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_mint_shares: {e}")
+        logger.exception("Error in sign_mint_shares")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_burn_shares")
 async def sign_burn_shares(request: SignBurnSharesRequest):
     """
-    Sign a burn shares transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign a burn shares transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignBurnShares.argtypes = [
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                    ctypes.c_longlong,
-                ]
-                signer.SignBurnShares.restype = StrOrErr
-
-                result = signer.SignBurnShares(
-                    request.public_pool_index,
-                    request.share_amount,
-                    managed_nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignBurnShares", *SIGN_BURN_SHARES_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_burn_shares: {e}")
+        logger.exception("Error in sign_burn_shares")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/sign_update_leverage")
 async def sign_update_leverage(request: SignUpdateLeverageRequest):
     """
-    Sign an update leverage transaction with per-account locking to prevent nonce conflicts.
-    Uses account-specific locks to serialize requests for the same (account_index, api_key_index).
+    Sign an update leverage transaction with the client-provided nonce.
+    The Go SDK call runs on the signer thread, serialized with all other signing.
     """
     try:
-        if not signer:
-            raise HTTPException(status_code=500, detail="Signer not initialized")
-
-        # Get API URL from client config for nonce initialization
-        client_key = get_client_key(request.api_key_index, request.account_index)
-        client_config = clients.get(client_key)
-        api_url = client_config.get("url") if client_config else None
-
-        # CRITICAL: Global lock MUST be outermost to prevent Go SDK state pollution
-        # Without this, different accounts can hold different account_locks simultaneously,
-        # then compete for global_signer_lock, causing state corruption
-        async with global_signer_lock:
-            # Get account-specific lock to prevent nonce race conditions for same account
-            account_lock = await nonce_manager.get_account_lock(request.account_index, request.api_key_index)
-
-            async with account_lock:
-                # Get managed nonce (auto-increment if request.nonce == -1)
-                managed_nonce = await nonce_manager.get_next_nonce(
-                    account_index=request.account_index,
-                    api_key_index=request.api_key_index,
-                    provided_nonce=request.nonce,
-                    api_url=api_url
-                )
-
-                # Activate client (already protected by global lock)
-                await _activate_client_internal(request.api_key_index, request.account_index)
-
-                signer.SignUpdateLeverage.argtypes = [
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_int,
-                    ctypes.c_longlong,
-                ]
-                signer.SignUpdateLeverage.restype = StrOrErr
-
-                result = signer.SignUpdateLeverage(
-                    request.market_index,
-                    request.fraction,
-                    request.margin_mode,
-                    managed_nonce
-                )
-
-                tx_info = result.str.decode("utf-8") if result.str else None
-                error = result.err.decode("utf-8") if result.err else None
-
-                if error:
-                    raise HTTPException(status_code=400, detail=error)
-
-                # Success - return result
-            return {"tx_info": tx_info}
+        tx_info = await _run_sign(request, "SignUpdateLeverage", *SIGN_UPDATE_LEVERAGE_ARGS(request))
+        return tx_info_response(tx_info)
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in sign_update_leverage: {e}")
+        logger.exception("Error in sign_update_leverage")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/create_auth_token")
 async def create_auth_token(request: CreateAuthTokenRequest):
     """
-    Create an authentication token. Thread-safe with global locking.
+    Create an authentication token. Thread-safe via the signer thread.
     """
     try:
         if not signer:
             raise HTTPException(status_code=500, detail="Signer not initialized")
 
-        # Acquire global lock to ensure atomic switch + create
-        async with global_signer_lock:
-            await _activate_client_internal(request.api_key_index, request.account_index)
-
-            signer.CreateAuthToken.argtypes = [ctypes.c_longlong]
-            signer.CreateAuthToken.restype = StrOrErr
+        result = await sign_with_client(
+            request.api_key_index, request.account_index,
+            signer.CreateAuthToken, request.deadline)
 
-            result = signer.CreateAuthToken(request.deadline)
+        auth, error = read_str_or_err(result)
 
-            auth = result.str.decode("utf-8") if result.str else None
-            error = result.err.decode("utf-8") if result.err else None
-
-            if error:
-                raise HTTPException(status_code=400, detail=error)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
 
         return {"auth_token": auth}
     except HTTPException:
         raise
     except Exception as e:
-        logging.error(f"Error in create_auth_token: {e}")
+        logger.exception("Error in create_auth_token")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Single-endpoint form of the sign_* routes: POST /sign with an "op" field selecting
+# the transaction. The body is validated against one discriminated union (pydantic
+# picks the model straight from "op") and dispatched through a dict, so high-rate
+# clients pay for one route instead of one per transaction type.
+class SignChangeApiKeyOp(SignChangeApiKeyRequest):
+    op: Literal["change_api_key"]
+
+
+class SignCreateOrderOp(SignCreateOrderRequest):
+    op: Literal["create_order"]
+
+
+class SignCancelOrderOp(SignCancelOrderRequest):
+    op: Literal["cancel_order"]
+
+
+class SignWithdrawOp(SignWithdrawRequest):
+    op: Literal["withdraw"]
+
+
+class SignCreateSubAccountOp(SignCreateSubAccountRequest):
+    op: Literal["create_sub_account"]
+
+
+class SignCancelAllOrdersOp(SignCancelAllOrdersRequest):
+    op: Literal["cancel_all_orders"]
+
+
+class SignModifyOrderOp(SignModifyOrderRequest):
+    op: Literal["modify_order"]
+
+
+class SignTransferOp(SignTransferRequest):
+    op: Literal["transfer"]
+
+
+class SignCreatePublicPoolOp(SignCreatePublicPoolRequest):
+    op: Literal["create_public_pool"]
+
+
+class SignUpdatePublicPoolOp(SignUpdatePublicPoolRequest):
+    op: Literal["update_public_pool"]
+
+
+class SignMintSharesOp(SignMintSharesRequest):
+    op: Literal["mint_shares"]
+
+
+class SignBurnSharesOp(SignBurnSharesRequest):
+    op: Literal["burn_shares"]
+
+
+class SignUpdateLeverageOp(SignUpdateLeverageRequest):
+    op: Literal["update_leverage"]
+
+
+class CreateAuthTokenOp(CreateAuthTokenRequest):
+    op: Literal["create_auth_token"]
+
+
+class SignRequest(RootModel[Annotated[
+    Union[
+        SignChangeApiKeyOp,
+        SignCreateOrderOp,
+        SignCancelOrderOp,
+        SignWithdrawOp,
+        SignCreateSubAccountOp,
+        SignCancelAllOrdersOp,
+        SignModifyOrderOp,
+        SignTransferOp,
+        SignCreatePublicPoolOp,
+        SignUpdatePublicPoolOp,
+        SignMintSharesOp,
+        SignBurnSharesOp,
+        SignUpdateLeverageOp,
+        CreateAuthTokenOp,
+    ],
+    Field(discriminator="op"),
+]]):
+    model_config = ConfigDict(frozen=True)
+
+
+SIGN_DISPATCH = {
+    "change_api_key": sign_change_api_key,
+    "create_order": sign_create_order,
+    "cancel_order": sign_cancel_order,
+    "withdraw": sign_withdraw,
+    "create_sub_account": sign_create_sub_account,
+    "cancel_all_orders": sign_cancel_all_orders,
+    "modify_order": sign_modify_order,
+    "transfer": sign_transfer,
+    "create_public_pool": sign_create_public_pool,
+    "update_public_pool": sign_update_public_pool,
+    "mint_shares": sign_mint_shares,
+    "burn_shares": sign_burn_shares,
+    "update_leverage": sign_update_leverage,
+    "create_auth_token": create_auth_token,
+}
+
+
+@app.post("/sign")
+async def sign(request: SignRequest):
+    """
+    Sign any transaction type selected by "op"; the rest of the body and the response
+    are the same as the matching /sign_<op> (or /create_auth_token) endpoint.
+    """
+    op_request = request.root
+    return await SIGN_DISPATCH[op_request.op](op_request)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=10000)
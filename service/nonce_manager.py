@@ -3,9 +3,8 @@ Nonce Manager for Signer Service
 Adapted from lighter-python's nonce_manager.py
 Manages nonce state to prevent signature conflicts
 """
-import asyncio
 import logging
-from typing import Dict, Tuple, Optional
+from typing import List
 
 logger = logging.getLogger(__name__)
 
@@ -20,27 +19,20 @@ class NonceManager:
     Nonce manager for signer service
 
     Responsibilities:
-    - Provide per-account locks to serialize signing requests
-    - Prevent concurrent nonce conflicts for same (account_index, api_key_index)
+    - Validate the client-provided nonce(s) before signing
 
     NOT responsible for:
     - Nonce caching (client provides nonce from Lighter API)
     - Nonce auto-increment (client manages nonce)
     - Nonce rollback (client retries with fresh nonce from API)
+    - Serializing signing (the service runs every Go SDK call on one signer thread)
     """
 
-    def __init__(self):
-        # Per-account locks to serialize requests for the same (account_index, api_key_index)
-        self.account_locks: Dict[Tuple[int, int], asyncio.Lock] = {}
-        # Lock to protect account_locks dictionary during concurrent access
-        self._locks_creation_lock = asyncio.Lock()
-
     async def get_next_nonce(
         self,
         account_index: int,
         api_key_index: int,
-        provided_nonce: int = -1,
-        api_url: Optional[str] = None
+        provided_nonce: int = -1
     ) -> int:
         """
         Get the nonce for signing - ALWAYS use client-provided value
@@ -49,7 +41,6 @@ class NonceManager:
             account_index: Account index
             api_key_index: API key index
             provided_nonce: Client-provided nonce from Lighter API (REQUIRED)
-            api_url: API URL (for reference only)
 
         Returns:
             Nonce to use for signing
@@ -65,37 +56,43 @@ class NonceManager:
                 f"Nonce management is client's responsibility to avoid IP exposure."
             )
 
-        logger.debug(f"Using client-provided nonce: account={account_index}, api_key={api_key_index}, nonce={provided_nonce}")
+        logger.debug("Using client-provided nonce: account=%s, api_key=%s, nonce=%s",
+                     account_index, api_key_index, provided_nonce)
 
         # Simply return client's value - no cache, no auto-increment, no interference
         return provided_nonce
 
-    async def get_account_lock(self, account_index: int, api_key_index: int) -> asyncio.Lock:
+    async def get_next_nonces(
+        self,
+        account_index: int,
+        api_key_index: int,
+        provided_nonces: List[int]
+    ) -> List[int]:
         """
-        Get or create a lock for a specific (account_index, api_key_index) pair.
-        This lock should be held during the entire signing process to prevent race conditions.
-
-        Thread-safe: Uses _locks_creation_lock to prevent race conditions when creating new locks.
+        Get the nonces for a batch of signing requests for one account in a single call
 
         Args:
             account_index: Account index
             api_key_index: API key index
+            provided_nonces: Client-provided nonces from Lighter API, one per request (REQUIRED)
 
         Returns:
-            Lock for this account/api_key pair
+            Nonces to use for signing, in request order
+
+        Raises:
+            ValueError: If client does not provide a nonce for every request
         """
-        key = (account_index, api_key_index)
-
-        # Fast path: lock already exists
-        if key in self.account_locks:
-            return self.account_locks[key]
-
-        # Slow path: need to create lock (protected by creation lock)
-        async with self._locks_creation_lock:
-            # Double-check: another thread might have created it while we waited
-            if key not in self.account_locks:
-                self.account_locks[key] = asyncio.Lock()
-            return self.account_locks[key]
+        if min(provided_nonces, default=0) < 0:
+            raise ValueError(
+                f"Client must provide nonce from Lighter API. "
+                f"account_index={account_index}, api_key_index={api_key_index}. "
+                f"Nonce management is client's responsibility to avoid IP exposure."
+            )
+
+        logger.debug("Using %s client-provided nonces: account=%s, api_key=%s",
+                     len(provided_nonces), account_index, api_key_index)
+
+        return list(provided_nonces)
 
 
 # Global singleton instance